@@ -2,7 +2,6 @@
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Date, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from datetime import datetime, date
 import uuid as uuid_lib
 
 from app.database import Base
@@ -38,8 +38,15 @@ async def login(
     """Login user and return JWT tokens"""
     user = await UserService.authenticate_user(db, user_data.email, user_data.password)
     
-    # Create tokens
-    access_token = create_access_token(data={"sub": str(user.id), "email": user.email})
+    # Create tokens; role/verification claims let authorization
+    # dependencies decide from the token alone
+    access_token = create_access_token(data={
+        "sub": str(user.id),
+        "email": user.email,
+        "role": user.role,
+        "verified": user.is_verified,
+        "staff": user.is_staff
+    })
     refresh_token = create_refresh_token(data={"sub": str(user.id), "email": user.email})
     
     return Token(
@@ -64,7 +71,13 @@ async def refresh_token(
     user = await UserService.get_user_by_id(db, int(user_id))
     
     # Create new tokens
-    access_token = create_access_token(data={"sub": str(user.id), "email": user.email})
+    access_token = create_access_token(data={
+        "sub": str(user.id),
+        "email": user.email,
+        "role": user.role,
+        "verified": user.is_verified,
+        "staff": user.is_staff
+    })
     refresh_token = create_refresh_token(data={"sub": str(user.id), "email": user.email})
     
     return Token(
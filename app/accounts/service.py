@@ -11,6 +11,7 @@ from app.accounts.models import User, UserProfile
 from app.accounts.schemas import UserCreate, UserUpdate, UserProfileUpdate
 from app.utils.security import get_password_hash, verify_password, generate_verification_code
 from app.utils.email import send_verification_email, send_password_reset_email, send_welcome_email
+from app.deps import invalidate_user_cache
 
 class UserService:
     
@@ -152,6 +153,7 @@ class UserService:
             )
         )
         await db.commit()
+        invalidate_user_cache(user.id)
         
         # Send welcome email
         await send_welcome_email(user.email, user.get_full_name())
@@ -272,6 +274,7 @@ class UserService:
             )
             await db.commit()
             await db.refresh(user)
+            invalidate_user_cache(user_id)
         
         return user
     
@@ -340,5 +343,6 @@ class UserService:
             .values(avatar=avatar_path)
         )
         await db.commit()
+        invalidate_user_cache(user_id)
         
         return await UserService.get_user_by_id(db, user_id)
\ No newline at end of file
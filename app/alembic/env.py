@@ -1,3 +1,5 @@
+import os
+import sys
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -5,6 +7,10 @@ from sqlalchemy import pool
 
 from alembic import context
 
+# Make the repo root importable so revisions can import the app's model
+# modules regardless of the directory alembic is invoked from.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
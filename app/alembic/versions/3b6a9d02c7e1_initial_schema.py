@@ -0,0 +1,42 @@
+"""Create the initial schema from the model metadata
+
+Revision ID: 3b6a9d02c7e1
+Revises:
+Create Date: 2026-08-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b6a9d02c7e1'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _metadata():
+    """Import every model module so the full schema is registered"""
+    import app.accounts.models  # noqa: F401
+    import app.courses.models  # noqa: F401
+    import app.core.models  # noqa: F401
+    from app.database import Base
+
+    return Base.metadata
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Baseline revision so `alembic upgrade head` bootstraps a fresh
+    # database. checkfirst makes this a no-op per existing table on
+    # databases that predate the migration chain, so later revisions in
+    # the chain stay responsible for their own objects.
+    _metadata().create_all(bind=op.get_bind(), checkfirst=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _metadata().drop_all(bind=op.get_bind(), checkfirst=True)
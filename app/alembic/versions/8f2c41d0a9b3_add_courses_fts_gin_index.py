@@ -0,0 +1,39 @@
+"""Add full-text search GIN index for course search
+
+Revision ID: 8f2c41d0a9b3
+Revises: 3b6a9d02c7e1
+Create Date: 2026-08-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2c41d0a9b3'
+down_revision: Union[str, Sequence[str], None] = '3b6a9d02c7e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Full-text search is PostgreSQL-only; the sqlite dev database keeps
+    # the ILIKE fallback in CourseService.get_courses.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        "CREATE INDEX ix_courses_fts ON courses USING GIN ("
+        "to_tsvector('english', coalesce(title,'') || ' ' || "
+        "coalesce(short_description,'') || ' ' || coalesce(description,''))"
+        ")"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_courses_fts")
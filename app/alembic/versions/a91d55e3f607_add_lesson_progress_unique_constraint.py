@@ -0,0 +1,47 @@
+"""Add unique constraint on lesson_progress (enrollment_id, lesson_id)
+
+Revision ID: a91d55e3f607
+Revises: c47e19b52d84
+Create Date: 2026-08-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91d55e3f607'
+down_revision: Union[str, Sequence[str], None] = 'c47e19b52d84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Anchors the ON CONFLICT upsert in update_lesson_progress and also
+    # deduplicates progress rows per enrollment/lesson pair. The baseline
+    # revision already creates it on fresh databases, so skip when present.
+    existing = {
+        c["name"]
+        for c in sa.inspect(op.get_bind()).get_unique_constraints("lesson_progress")
+    }
+    if "uq_lesson_progress_enrollment_lesson" in existing:
+        return
+    # Batch mode rebuilds the table on SQLite, where ALTER TABLE cannot
+    # add a constraint in place; on PostgreSQL it is a plain ALTER.
+    with op.batch_alter_table("lesson_progress") as batch_op:
+        batch_op.create_unique_constraint(
+            "uq_lesson_progress_enrollment_lesson",
+            ["enrollment_id", "lesson_id"],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("lesson_progress") as batch_op:
+        batch_op.drop_constraint(
+            "uq_lesson_progress_enrollment_lesson",
+            type_="unique",
+        )
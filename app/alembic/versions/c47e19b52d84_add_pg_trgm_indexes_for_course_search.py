@@ -0,0 +1,49 @@
+"""Add pg_trgm GIN indexes so ILIKE course search can use an index
+
+Revision ID: c47e19b52d84
+Revises: 8f2c41d0a9b3
+Create Date: 2026-08-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47e19b52d84'
+down_revision: Union[str, Sequence[str], None] = '8f2c41d0a9b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Trigram GIN indexes let Postgres satisfy %term% ILIKE patterns via
+    # a bitmap index scan, keeping any remaining substring search paths
+    # off sequential scans without changing query shape.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_courses_title_trgm ON courses "
+        "USING GIN (title gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_courses_short_description_trgm ON courses "
+        "USING GIN (short_description gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_courses_description_trgm ON courses "
+        "USING GIN (description gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_courses_description_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_courses_short_description_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_courses_title_trgm")
@@ -0,0 +1,60 @@
+"""Add composite indexes for the hot list-endpoint filters and sorts
+
+Revision ID: e3b8a27c6f91
+Revises: a91d55e3f607
+Create Date: 2026-08-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b8a27c6f91'
+down_revision: Union[str, Sequence[str], None] = 'a91d55e3f607'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The baseline revision creates these via the model metadata on fresh
+    # databases; only add the ones an older database is missing.
+    inspector = sa.inspect(op.get_bind())
+
+    def _missing(table: str, name: str) -> bool:
+        return name not in {ix["name"] for ix in inspector.get_indexes(table)}
+
+    if _missing("courses", "ix_courses_pub_created"):
+        op.create_index(
+            "ix_courses_pub_created",
+            "courses",
+            ["status", sa.text("created_at DESC")],
+        )
+    if _missing("courses", "ix_courses_cat_pub"):
+        op.create_index("ix_courses_cat_pub", "courses", ["category_id", "status"])
+    if _missing("courses", "ix_courses_instr_pub"):
+        op.create_index("ix_courses_instr_pub", "courses", ["instructor_id", "status"])
+    if _missing("enrollments", "ix_enroll_student_active"):
+        op.create_index(
+            "ix_enroll_student_active",
+            "enrollments",
+            ["student_id", "is_active", sa.text("enrolled_at DESC")],
+        )
+    if _missing("quiz_attempts", "ix_qattempt_quiz_student"):
+        op.create_index(
+            "ix_qattempt_quiz_student",
+            "quiz_attempts",
+            ["quiz_id", "student_id"],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_qattempt_quiz_student", table_name="quiz_attempts")
+    op.drop_index("ix_enroll_student_active", table_name="enrollments")
+    op.drop_index("ix_courses_instr_pub", table_name="courses")
+    op.drop_index("ix_courses_cat_pub", table_name="courses")
+    op.drop_index("ix_courses_pub_created", table_name="courses")
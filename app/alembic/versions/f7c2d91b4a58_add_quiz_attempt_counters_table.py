@@ -0,0 +1,51 @@
+"""Add quiz_attempt_counters table for O(1) attempt-limit checks
+
+Revision ID: f7c2d91b4a58
+Revises: e3b8a27c6f91
+Create Date: 2026-08-27
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c2d91b4a58'
+down_revision: Union[str, Sequence[str], None] = 'e3b8a27c6f91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    # The baseline revision already creates the (empty) table on fresh
+    # databases, so only the DDL is skippable; the seed below must still
+    # run wherever the counters are empty.
+    if "quiz_attempt_counters" not in sa.inspect(bind).get_table_names():
+        op.create_table(
+            "quiz_attempt_counters",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("quiz_id", sa.Integer(), sa.ForeignKey("quizzes.id"), nullable=False),
+            sa.Column("student_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("attempts_used", sa.Integer(), nullable=False, server_default="0"),
+            sa.UniqueConstraint("quiz_id", "student_id", name="uq_quiz_attempt_counter"),
+        )
+        op.create_index("ix_quiz_attempt_counters_id", "quiz_attempt_counters", ["id"])
+    # Seed counters from the existing attempt history so limits stay
+    # accurate for students with prior attempts. ON CONFLICT keeps this
+    # idempotent if some pairs were already counted.
+    op.execute(
+        "INSERT INTO quiz_attempt_counters (quiz_id, student_id, attempts_used) "
+        "SELECT quiz_id, student_id, COUNT(*) FROM quiz_attempts "
+        "GROUP BY quiz_id, student_id "
+        "ON CONFLICT (quiz_id, student_id) DO NOTHING"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_quiz_attempt_counters_id", table_name="quiz_attempt_counters")
+    op.drop_table("quiz_attempt_counters")
@@ -17,6 +17,9 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./elearning.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800
     
     # CORS
     CORS_ORIGINS: List[str] = [
@@ -55,4 +58,5 @@ settings = Settings()
 # Create upload directories
 os.makedirs(f"{settings.UPLOAD_DIR}/avatars", exist_ok=True)
 os.makedirs(f"{settings.UPLOAD_DIR}/courses", exist_ok=True)
-os.makedirs(f"{settings.UPLOAD_DIR}/certificates", exist_ok=True)
\ No newline at end of file
+os.makedirs(f"{settings.UPLOAD_DIR}/certificates", exist_ok=True)
+os.makedirs("app/static/qr", exist_ok=True)
\ No newline at end of file
@@ -121,7 +121,9 @@ class ActivityLog(Base):
     lesson_id = Column(Integer, ForeignKey("lessons.id"), nullable=True)
     quiz_id = Column(Integer, ForeignKey("quizzes.id"), nullable=True)
     
-    metadata = Column(JSON, default=dict)
+    # "metadata" is reserved on Declarative classes; keep the column name
+    # and expose it under a safe attribute
+    activity_metadata = Column("metadata", JSON, default=dict)
     ip_address = Column(String, nullable=True)
     user_agent = Column(Text, nullable=True)
     
@@ -1,5 +1,5 @@
 # app/core/schemas.py
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -192,7 +192,9 @@ class ActivityLog(BaseModel):
     course_id: Optional[int] = None
     lesson_id: Optional[int] = None
     quiz_id: Optional[int] = None
-    metadata: Dict[str, Any] = {}
+    # ORM attribute is activity_metadata (metadata is reserved there);
+    # the response keeps the plain field name
+    metadata: Dict[str, Any] = Field(default={}, validation_alias='activity_metadata')
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
     created_at: datetime
@@ -1,8 +1,7 @@
 # app/courses/models.py
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Date, ForeignKey, Decimal, Table
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Date, ForeignKey, Numeric, Table, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from datetime import datetime
 import uuid as uuid_lib
 
 from app.database import Base
@@ -116,7 +115,7 @@ class Enrollment(Base):
     completed_at = Column(DateTime, nullable=True)
     last_accessed = Column(DateTime, nullable=True)
     
-    progress_percentage = Column(Decimal(5, 2), default=0)
+    progress_percentage = Column(Numeric(5, 2), default=0)
     status = Column(String, default="enrolled")  # enrolled, in_progress, completed, dropped
     is_active = Column(Boolean, default=True)
     
@@ -185,6 +184,9 @@ class Lesson(Base):
 
 class LessonProgress(Base):
     __tablename__ = "lesson_progress"
+    __table_args__ = (
+        UniqueConstraint("enrollment_id", "lesson_id", name="uq_lesson_progress_enrollment_lesson"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     uuid = Column(String, default=lambda: str(uuid_lib.uuid4()), unique=True, index=True)
@@ -306,7 +308,7 @@ class QuizAttempt(Base):
     
     started_at = Column(DateTime, server_default=func.now())
     completed_at = Column(DateTime, nullable=True)
-    score = Column(Decimal(5, 2), nullable=True)
+    score = Column(Numeric(5, 2), nullable=True)
     passed = Column(Boolean, default=False)
     time_taken_seconds = Column(Integer, nullable=True)
     attempt_number = Column(Integer, default=1)
@@ -317,6 +319,17 @@ class QuizAttempt(Base):
     enrollment = relationship("Enrollment", back_populates="quiz_attempts")
     responses = relationship("QuestionResponse", back_populates="attempt")
 
+class QuizAttemptCounter(Base):
+    __tablename__ = "quiz_attempt_counters"
+    __table_args__ = (
+        UniqueConstraint("quiz_id", "student_id", name="uq_quiz_attempt_counter"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    quiz_id = Column(Integer, ForeignKey("quizzes.id"), nullable=False)
+    student_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    attempts_used = Column(Integer, default=0, nullable=False)
+
 class QuestionResponse(Base):
     __tablename__ = "question_responses"
     
@@ -327,7 +340,7 @@ class QuestionResponse(Base):
     selected_answer_id = Column(Integer, ForeignKey("answers.id"), nullable=True)
     
     text_response = Column(Text, nullable=True)
-    points_earned = Column(Decimal(5, 2), default=0)
+    points_earned = Column(Numeric(5, 2), default=0)
     is_correct = Column(Boolean, nullable=True)
     feedback = Column(Text, nullable=True)
     
@@ -352,7 +365,7 @@ class Certificate(Base):
     issue_date = Column(Date, server_default=func.current_date())
     expiry_date = Column(Date, nullable=True)
     completion_date = Column(Date, nullable=False)
-    final_score = Column(Decimal(5, 2), nullable=True)
+    final_score = Column(Numeric(5, 2), nullable=True)
     
     pdf_file = Column(String, nullable=True)
     qr_code = Column(String, nullable=True)
@@ -385,4 +398,18 @@ class CourseReview(Base):
     
     # Relationships
     course = relationship("Course", back_populates="reviews")
-    student = relationship("User", back_populates="course_reviews")
\ No newline at end of file
+    student = relationship("User", back_populates="course_reviews")
+
+# Composite indexes for the hot list-endpoint filters and sorts, so
+# get_courses and get_user_enrollments become index scans instead of
+# sort-limits over a full table scan
+Index("ix_courses_pub_created", Course.status, Course.created_at.desc())
+Index("ix_courses_cat_pub", Course.category_id, Course.status)
+Index("ix_courses_instr_pub", Course.instructor_id, Course.status)
+Index(
+    "ix_enroll_student_active",
+    Enrollment.student_id,
+    Enrollment.is_active,
+    Enrollment.enrolled_at.desc()
+)
+Index("ix_qattempt_quiz_student", QuizAttempt.quiz_id, QuizAttempt.student_id)
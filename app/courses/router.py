@@ -1,5 +1,8 @@
 # app/courses/router.py
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
@@ -8,12 +11,14 @@ from app.deps import get_current_user, get_verified_user, get_teacher_user
 from app.accounts.models import User
 from app.courses.service import CourseService
 from app.courses.schemas import (
-    Category, CategoryCreate, Course, CourseCreate, CourseUpdate, CourseList,
+    Category, CategoryCreate, CategoryTreeNode, Course, CourseCreate, CourseUpdate, CourseList,
     Module, ModuleCreate, ModuleUpdate, Lesson, LessonCreate, LessonUpdate,
     Quiz, QuizCreate, QuizUpdate, Question, QuestionCreate,
     Enrollment, EnrollmentCreate, LessonProgress, LessonProgressUpdate,
     QuizAttempt, QuizSubmission, Certificate, CourseReview, CourseReviewCreate,
-    StandardResponse, Tag
+    StandardResponse, Tag, CoursePage, CoursePageAdapter,
+    EnrollmentPage, EnrollmentPageAdapter,
+    CourseReviewListAdapter, QuizAttemptResponseAdapter
 )
 from app.utils.file_upload import save_course_content, save_avatar
 from app.utils.security import validate_uuid
@@ -37,6 +42,13 @@ async def create_category(
     """Create new category (teachers and above)"""
     return await CourseService.create_category(db, category_data)
 
+@router.get("/categories/tree", response_model=List[CategoryTreeNode])
+async def get_category_tree(
+    db: AsyncSession = Depends(get_db)
+):
+    """Get active categories as a nested tree"""
+    return await CourseService.get_category_tree(db)
+
 @router.get("/categories/{slug}", response_model=Category)
 async def get_category(
     slug: str,
@@ -46,9 +58,9 @@ async def get_category(
     return await CourseService.get_category_by_slug(db, slug)
 
 # Courses
-@router.get("/courses", response_model=List[CourseList])
+@router.get("/courses", response_model=None)
 async def get_courses(
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     limit: int = Query(20, ge=1, le=100),
     category_id: Optional[int] = None,
     level: Optional[str] = None,
@@ -69,9 +81,9 @@ async def get_courses(
     elif instructor_id:
         instructor_filter = instructor_id
     
-    courses = await CourseService.get_courses(
+    courses, next_cursor = await CourseService.get_courses(
         db=db,
-        skip=skip,
+        cursor=cursor,
         limit=limit,
         category_id=category_id,
         level=level,
@@ -90,8 +102,13 @@ async def get_courses(
         # Calculate average rating
         if course.reviews:
             course.average_rating = sum(r.rating for r in course.reviews) / len(course.reviews)
-    
-    return courses
+
+    # Serialize on the pydantic-core Rust path instead of jsonable_encoder
+    page = CoursePage.model_construct(
+        items=[CourseList.from_orm_fast(c) for c in courses],
+        next_cursor=next_cursor
+    )
+    return Response(content=CoursePageAdapter.dump_json(page), media_type="application/json")
 
 @router.post("/courses", response_model=Course)
 async def create_course(
@@ -140,7 +157,7 @@ async def update_course(
     
     # Check permissions
     if (course.instructor_id != current_user.id and 
-        current_user not in course.co_instructors and 
+        current_user.id not in [u.id for u in course.co_instructors] and 
         not current_user.is_staff):
         raise HTTPException(status_code=403, detail="Not authorized to update this course")
     
@@ -179,7 +196,7 @@ async def upload_course_thumbnail(
     
     # Check permissions
     if (course.instructor_id != current_user.id and 
-        current_user not in course.co_instructors and 
+        current_user.id not in [u.id for u in course.co_instructors] and 
         not current_user.is_staff):
         raise HTTPException(status_code=403, detail="Not authorized to update this course")
     
@@ -199,14 +216,23 @@ async def upload_course_thumbnail(
     )
 
 # Enrollments
-@router.get("/enrollments/my-courses", response_model=List[Enrollment])
+@router.get("/enrollments/my-courses", response_model=None)
 async def get_my_enrollments(
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_verified_user)
 ):
     """Get current user's enrollments"""
-    return await CourseService.get_user_enrollments(db, current_user.id, status)
+    enrollments, next_cursor = await CourseService.get_user_enrollments(
+        db, current_user.id, status, cursor=cursor, limit=limit
+    )
+    page = EnrollmentPage.model_construct(
+        items=[Enrollment.from_orm_fast(e) for e in enrollments],
+        next_cursor=next_cursor
+    )
+    return Response(content=EnrollmentPageAdapter.dump_json(page), media_type="application/json")
 
 # Modules
 @router.post("/modules", response_model=Module)
@@ -219,7 +245,7 @@ async def create_module(
     # Verify user can create modules for this course
     course = await CourseService._get_course_by_id(db, module_data.course_id)
     if (course.instructor_id != current_user.id and 
-        current_user not in course.co_instructors and 
+        current_user.id not in [u.id for u in course.co_instructors] and 
         not current_user.is_staff):
         raise HTTPException(status_code=403, detail="Not authorized to create modules for this course")
     
@@ -246,7 +272,7 @@ async def create_lesson(
     
     course = await CourseService._get_course_by_id(db, module.course_id)
     if (course.instructor_id != current_user.id and 
-        current_user not in course.co_instructors and 
+        current_user.id not in [u.id for u in course.co_instructors] and 
         not current_user.is_staff):
         raise HTTPException(status_code=403, detail="Not authorized to create lessons for this course")
     
@@ -287,7 +313,7 @@ async def get_lesson(
     
     if (not enrollment_check.scalar_one_or_none() and 
         course.instructor_id != current_user.id and 
-        current_user not in course.co_instructors and 
+        current_user.id not in [u.id for u in course.co_instructors] and 
         not current_user.is_staff):
         raise HTTPException(status_code=403, detail="Not enrolled in this course")
     
@@ -335,7 +361,7 @@ async def upload_lesson_content(
     # Check permissions
     course = await CourseService._get_course_by_id(db, course_id)
     if (course.instructor_id != current_user.id and 
-        current_user not in course.co_instructors and 
+        current_user.id not in [u.id for u in course.co_instructors] and 
         not current_user.is_staff):
         raise HTTPException(status_code=403, detail="Not authorized to upload content for this lesson")
     
@@ -368,7 +394,7 @@ async def create_quiz(
     # Verify permissions
     course = await CourseService._get_course_by_id(db, quiz_data.course_id)
     if (course.instructor_id != current_user.id and 
-        current_user not in course.co_instructors and 
+        current_user.id not in [u.id for u in course.co_instructors] and 
         not current_user.is_staff):
         raise HTTPException(status_code=403, detail="Not authorized to create quizzes for this course")
     
@@ -381,9 +407,16 @@ async def submit_quiz(
     current_user: User = Depends(get_verified_user)
 ):
     """Submit quiz attempt"""
+    try:
+        submission.responses = QuizAttemptResponseAdapter.validate_python(
+            submission.responses
+        )
+    except ValidationError as e:
+        # Surface deferred response validation as the usual 422, not a 500
+        raise RequestValidationError(e.errors())
     return await CourseService.submit_quiz(db, current_user.id, submission)
 
-@router.get("/quizzes/{uuid}/attempts", response_model=List[QuizAttempt])
+@router.get("/quizzes/{uuid}/attempts", response_model=None)
 async def get_quiz_attempts(
     uuid: str,
     db: AsyncSession = Depends(get_db),
@@ -413,8 +446,9 @@ async def get_quiz_attempts(
             )
         ).order_by(QuizAttemptModel.started_at.desc())
     )
-    
-    return attempts_result.scalars().all()
+
+    # Trusted DB rows; skip response_model re-validation
+    return [QuizAttempt.from_orm_fast(a) for a in attempts_result.scalars().all()]
 
 # Reviews
 @router.post("/reviews", response_model=CourseReview)
@@ -426,7 +460,7 @@ async def create_course_review(
     """Create course review"""
     return await CourseService.create_review(db, current_user.id, review_data)
 
-@router.get("/courses/{uuid}/reviews", response_model=List[CourseReview])
+@router.get("/courses/{uuid}/reviews", response_model=None)
 async def get_course_reviews(
     uuid: str,
     skip: int = Query(0, ge=0),
@@ -462,11 +496,20 @@ async def get_course_reviews(
         if review.student:
             review.student_name = review.student.get_full_name()
             review.student_avatar = review.student.avatar
-    
-    return reviews
+
+    # Validate on the experimental partial fast path and dump straight to
+    # JSON bytes; switch to pydantic's FastModel here once it graduates
+    # from the experimental namespace.
+    validated = CourseReviewListAdapter.validate_python(
+        reviews, from_attributes=True, experimental_allow_partial='trailing-strings'
+    )
+    return Response(
+        content=CourseReviewListAdapter.dump_json(validated),
+        media_type="application/json"
+    )
 
 # Certificates
-@router.get("/certificates", response_model=List[Certificate])
+@router.get("/certificates", response_model=None)
 async def get_user_certificates(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_verified_user)
@@ -480,8 +523,9 @@ async def get_user_certificates(
         .where(CertificateModel.student_id == current_user.id)
         .order_by(CertificateModel.issue_date.desc())
     )
-    
-    return result.scalars().all()
+
+    # Trusted DB rows; skip response_model re-validation
+    return [Certificate.from_orm_fast(c) for c in result.scalars().all()]
 
 @router.get("/certificates/{uuid}", response_model=Certificate)
 async def get_certificate(
@@ -553,7 +597,7 @@ async def get_course_analytics(
     
     # Check permissions
     if (course.instructor_id != current_user.id and 
-        current_user not in course.co_instructors and 
+        current_user.id not in [u.id for u in course.co_instructors] and 
         not current_user.is_staff):
         raise HTTPException(status_code=403, detail="Not authorized to view analytics for this course")
     
@@ -1,10 +1,111 @@
 # app/courses/schemas.py
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List
+from pydantic import BaseModel, Field, ConfigDict, PlainSerializer, SkipValidation, StringConstraints, TypeAdapter, create_model
+from pydantic.fields import FieldInfo
+from typing import Annotated, Optional, List, Union, get_args, get_origin
 from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
 
+# Shared config for read-side models hydrated from trusted ORM rows.
+# extra="ignore" keeps pydantic-core from allocating __pydantic_extra__
+# per instance, which matters on large list responses.
+RESPONSE_CONFIG = ConfigDict(
+    from_attributes=True,
+    extra="ignore",
+    populate_by_name=False,
+    arbitrary_types_allowed=False,
+    validate_assignment=False,
+    validate_default=False
+)
+
+# Optional timestamps on read models arrive from the ORM as datetime or
+# None already; a plain serializer swaps pydantic's nullable-datetime
+# union serializer for one monomorphic call per field.
+# Immutable read DTOs are additionally frozen: pydantic-core skips the
+# __setattr__ validator and instances become hashable.
+FROZEN_RESPONSE_CONFIG = ConfigDict(
+    from_attributes=True,
+    extra="ignore",
+    populate_by_name=False,
+    arbitrary_types_allowed=False,
+    validate_assignment=False,
+    validate_default=False,
+    frozen=True
+)
+
+# Constrained string aliases shared across entities; identical Annotated
+# metadata is deduped by pydantic-core into a single compiled validator.
+# Enforced on input schemas only; read models return whatever the row
+# holds so pre-existing data can never 500 its own response validation.
+Slug = Annotated[str, StringConstraints(min_length=1, max_length=200, pattern=r'^[a-z0-9-]+$')]
+UUIDStr = Annotated[str, StringConstraints(min_length=36, max_length=36)]
+
+OptionalDatetime = Annotated[
+    Optional[datetime],
+    PlainSerializer(lambda v: v.isoformat() if v else None)
+]
+OptionalDate = Annotated[
+    Optional[date],
+    PlainSerializer(lambda v: v.isoformat() if v else None)
+]
+
+def _partial_model(name: str, base: type, **extra_fields):
+    """Derive an all-optional update schema from its base model.
+
+    The update variants repeat the base field lists with Optional types;
+    deriving them lets pydantic reuse the base's cached core schemas
+    instead of rebuilding the same shape a third time per entity.
+    Constraint metadata (patterns, bounds) rides along via the merged
+    FieldInfo so partial updates validate like the base fields do.
+    """
+    fields = {
+        k: (Optional[f.annotation], FieldInfo.merge_field_infos(f, default=None))
+        for k, f in base.model_fields.items()
+    }
+    fields.update(extra_fields)
+    return create_model(name, __base__=base, **fields)
+
+def _unwrap_optional(annotation):
+    """Strip Optional[...] down to its concrete type, if that's the shape"""
+    if get_origin(annotation) is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+class ORMFastMixin:
+    """Fast hydration path for rows coming straight from the database.
+
+    The ORM already returns correctly-typed columns, so full validation
+    per row is wasted work on large reads; model_construct skips it.
+    Enum and Decimal fields are the exception: the driver hands back str
+    and float, which the serializer would flag on every dump, so those
+    few fields get coerced from a per-class map built once.
+    """
+
+    @classmethod
+    def _orm_fast_coercions(cls):
+        coercions = cls.__dict__.get('_orm_fast_coercions_cache')
+        if coercions is None:
+            coercions = {}
+            for name, field in cls.model_fields.items():
+                annotation = _unwrap_optional(field.annotation)
+                if isinstance(annotation, type) and issubclass(annotation, Enum):
+                    coercions[name] = annotation
+                elif annotation is Decimal:
+                    coercions[name] = lambda v: v if isinstance(v, Decimal) else Decimal(str(v))
+            cls._orm_fast_coercions_cache = coercions
+        return coercions
+
+    @classmethod
+    def from_orm_fast(cls, obj):
+        coercions = cls._orm_fast_coercions()
+        data = {f: getattr(obj, f, None) for f in cls.model_fields}
+        for name, coerce in coercions.items():
+            if data[name] is not None:
+                data[name] = coerce(data[name])
+        return cls.model_construct(**data)
+
 # Enums
 class CourseLevel(str, Enum):
     BEGINNER = "beginner"
@@ -45,7 +146,7 @@ class QuestionType(str, Enum):
 # Category Schemas
 class CategoryBase(BaseModel):
     name: str
-    slug: str
+    slug: Slug
     description: Optional[str] = None
     icon: Optional[str] = None
     order: int = 0
@@ -54,37 +155,44 @@ class CategoryBase(BaseModel):
 class CategoryCreate(CategoryBase):
     parent_id: Optional[int] = None
 
-class CategoryUpdate(CategoryBase):
-    name: Optional[str] = None
-    slug: Optional[str] = None
+CategoryUpdate = _partial_model('CategoryUpdate', CategoryBase)
 
 class Category(CategoryBase):
     model_config = ConfigDict(from_attributes=True)
-    
+
+    slug: str
     id: int
-    uuid: str
+    uuid: UUIDStr
     parent_id: Optional[int] = None
     created_at: datetime
     updated_at: datetime
-    subcategories: List['Category'] = []
+
+# Only the /categories/tree endpoint pays the recursive-schema cost;
+# flat category reads stay non-recursive.
+class CategoryTreeNode(BaseModel):
+    id: int
+    name: str
+    slug: str
+    children: List['CategoryTreeNode'] = []
 
 # Tag Schemas
 class TagBase(BaseModel):
     name: str
-    slug: str
+    slug: Slug
 
 class TagCreate(TagBase):
     pass
 
 class Tag(TagBase):
-    model_config = ConfigDict(from_attributes=True)
-    
+    model_config = FROZEN_RESPONSE_CONFIG
+
+    slug: str
     id: int
 
 # Course Schemas
 class CourseBase(BaseModel):
     title: str
-    slug: str
+    slug: Slug
     description: str
     short_description: str
     level: CourseLevel = CourseLevel.BEGINNER
@@ -101,27 +209,25 @@ class CourseCreate(CourseBase):
     category_id: Optional[int] = None
     tags: List[str] = []
 
-class CourseUpdate(CourseBase):
-    title: Optional[str] = None
-    slug: Optional[str] = None
-    description: Optional[str] = None
-    short_description: Optional[str] = None
-    learning_outcomes: Optional[str] = None
-    category_id: Optional[int] = None
-    tags: List[str] = []
+CourseUpdate = _partial_model(
+    'CourseUpdate', CourseBase,
+    category_id=(Optional[int], None),
+    tags=(List[str], [])
+)
 
-class CourseList(CourseBase):
-    model_config = ConfigDict(from_attributes=True)
-    
+class CourseList(ORMFastMixin, CourseBase):
+    model_config = RESPONSE_CONFIG
+
+    slug: str
     id: int
-    uuid: str
+    uuid: UUIDStr
     instructor_id: int
     category_id: Optional[int] = None
     status: CourseStatus
     views_count: int = 0
     created_at: datetime
     updated_at: datetime
-    published_at: Optional[datetime] = None
+    published_at: OptionalDatetime = None
     
     # Computed fields
     instructor_name: Optional[str] = None
@@ -149,14 +255,13 @@ class ModuleBase(BaseModel):
 class ModuleCreate(ModuleBase):
     course_id: int
 
-class ModuleUpdate(ModuleBase):
-    title: Optional[str] = None
+ModuleUpdate = _partial_model('ModuleUpdate', ModuleBase)
 
 class Module(ModuleBase):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_CONFIG
     
     id: int
-    uuid: str
+    uuid: UUIDStr
     course_id: int
     created_at: datetime
     updated_at: datetime
@@ -165,7 +270,7 @@ class Module(ModuleBase):
 # Lesson Schemas
 class LessonBase(BaseModel):
     title: str
-    slug: str
+    slug: Slug
     description: Optional[str] = None
     content_type: ContentType = ContentType.VIDEO
     video_url: Optional[str] = None
@@ -181,15 +286,14 @@ class LessonBase(BaseModel):
 class LessonCreate(LessonBase):
     module_id: int
 
-class LessonUpdate(LessonBase):
-    title: Optional[str] = None
-    slug: Optional[str] = None
+LessonUpdate = _partial_model('LessonUpdate', LessonBase)
 
 class Lesson(LessonBase):
-    model_config = ConfigDict(from_attributes=True)
-    
+    model_config = RESPONSE_CONFIG
+
+    slug: str
     id: int
-    uuid: str
+    uuid: UUIDStr
     module_id: int
     file_attachment: Optional[str] = None
     created_at: datetime
@@ -210,10 +314,10 @@ class ResourceCreate(ResourceBase):
     lesson_id: int
 
 class Resource(ResourceBase):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = FROZEN_RESPONSE_CONFIG
     
     id: int
-    uuid: str
+    uuid: UUIDStr
     lesson_id: int
     file: Optional[str] = None
     created_at: datetime
@@ -222,22 +326,22 @@ class Resource(ResourceBase):
 class EnrollmentCreate(BaseModel):
     course_id: int
 
-class Enrollment(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+class Enrollment(ORMFastMixin, BaseModel):
+    model_config = RESPONSE_CONFIG
     
     id: int
-    uuid: str
+    uuid: UUIDStr
     student_id: int
     course_id: int
     enrolled_at: datetime
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
-    last_accessed: Optional[datetime] = None
+    started_at: OptionalDatetime = None
+    completed_at: OptionalDatetime = None
+    last_accessed: OptionalDatetime = None
     progress_percentage: Decimal
     status: EnrollmentStatus
     is_active: bool
     certificate_issued: bool
-    certificate_issued_at: Optional[datetime] = None
+    certificate_issued_at: OptionalDatetime = None
 
 # Progress Schemas
 class LessonProgressUpdate(BaseModel):
@@ -245,15 +349,15 @@ class LessonProgressUpdate(BaseModel):
     time_spent_seconds: int = 0
     notes: Optional[str] = None
 
-class LessonProgress(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+class LessonProgress(ORMFastMixin, BaseModel):
+    model_config = FROZEN_RESPONSE_CONFIG
     
     id: int
-    uuid: str
+    uuid: UUIDStr
     enrollment_id: int
     lesson_id: int
     started_at: datetime
-    completed_at: Optional[datetime] = None
+    completed_at: OptionalDatetime = None
     last_position: int = 0
     is_completed: bool = False
     time_spent_seconds: int = 0
@@ -269,11 +373,11 @@ class AnswerBase(BaseModel):
 class AnswerCreate(AnswerBase):
     pass
 
-class Answer(AnswerBase):
-    model_config = ConfigDict(from_attributes=True)
+class Answer(ORMFastMixin, AnswerBase):
+    model_config = FROZEN_RESPONSE_CONFIG
     
     id: int
-    uuid: str
+    uuid: UUIDStr
     question_id: int
 
 class QuestionBase(BaseModel):
@@ -287,15 +391,16 @@ class QuestionBase(BaseModel):
 class QuestionCreate(QuestionBase):
     answers: List[AnswerCreate] = []
 
-class QuestionUpdate(QuestionBase):
-    question_text: Optional[str] = None
-    answers: List[AnswerCreate] = []
+QuestionUpdate = _partial_model(
+    'QuestionUpdate', QuestionBase,
+    answers=(List[AnswerCreate], [])
+)
 
 class Question(QuestionBase):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_CONFIG
     
     id: int
-    uuid: str
+    uuid: UUIDStr
     quiz_id: int
     created_at: datetime
     updated_at: datetime
@@ -311,8 +416,8 @@ class QuizBase(BaseModel):
     randomize_questions: bool = True
     randomize_answers: bool = True
     show_correct_answers: bool = True
-    available_from: Optional[datetime] = None
-    available_until: Optional[datetime] = None
+    available_from: OptionalDatetime = None
+    available_until: OptionalDatetime = None
     is_published: bool = False
 
 class QuizCreate(QuizBase):
@@ -320,14 +425,13 @@ class QuizCreate(QuizBase):
     module_id: Optional[int] = None
     lesson_id: Optional[int] = None
 
-class QuizUpdate(QuizBase):
-    title: Optional[str] = None
+QuizUpdate = _partial_model('QuizUpdate', QuizBase)
 
 class Quiz(QuizBase):
     model_config = ConfigDict(from_attributes=True)
     
     id: int
-    uuid: str
+    uuid: UUIDStr
     course_id: int
     module_id: Optional[int] = None
     lesson_id: Optional[int] = None
@@ -343,35 +447,40 @@ class QuizAttemptResponse(BaseModel):
 
 class QuizSubmission(BaseModel):
     quiz_id: int
-    responses: List[QuizAttemptResponse]
-
-class QuizAttempt(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    # Validated in one batch at the route via QuizAttemptResponseAdapter,
+    # which keeps this schema's graph to a single int field instead of
+    # dispatching the per-response validator through the outer model.
+    # SkipValidation keeps the item type in the OpenAPI schema without
+    # reintroducing per-item validation here.
+    responses: SkipValidation[List[QuizAttemptResponse]]
+
+class QuizAttempt(ORMFastMixin, BaseModel):
+    model_config = FROZEN_RESPONSE_CONFIG
     
     id: int
-    uuid: str
+    uuid: UUIDStr
     quiz_id: int
     student_id: int
     enrollment_id: int
     started_at: datetime
-    completed_at: Optional[datetime] = None
+    completed_at: OptionalDatetime = None
     score: Optional[Decimal] = None
     passed: bool = False
     time_taken_seconds: Optional[int] = None
     attempt_number: int = 1
 
 # Certificate Schemas
-class Certificate(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+class Certificate(ORMFastMixin, BaseModel):
+    model_config = FROZEN_RESPONSE_CONFIG
     
     id: int
-    uuid: str
+    uuid: UUIDStr
     certificate_number: str
     student_id: int
     course_id: int
     enrollment_id: int
     issue_date: date
-    expiry_date: Optional[date] = None
+    expiry_date: OptionalDate = None
     completion_date: date
     final_score: Optional[Decimal] = None
     pdf_file: Optional[str] = None
@@ -382,22 +491,24 @@ class Certificate(BaseModel):
     updated_at: datetime
 
 # Review Schemas
+# Shared constrained type: identical Annotated metadata lets pydantic-core
+# dedupe the rating validator across the create/update variants.
+Rating = Annotated[int, Field(ge=1, le=5)]
+
 class CourseReviewBase(BaseModel):
-    rating: int = Field(..., ge=1, le=5)
+    rating: Rating
     comment: str
 
 class CourseReviewCreate(CourseReviewBase):
     course_id: int
 
-class CourseReviewUpdate(CourseReviewBase):
-    rating: Optional[int] = Field(None, ge=1, le=5)
-    comment: Optional[str] = None
+CourseReviewUpdate = _partial_model('CourseReviewUpdate', CourseReviewBase)
 
-class CourseReview(CourseReviewBase):
-    model_config = ConfigDict(from_attributes=True)
+class CourseReview(ORMFastMixin, CourseReviewBase):
+    model_config = RESPONSE_CONFIG
     
     id: int
-    uuid: str
+    uuid: UUIDStr
     course_id: int
     student_id: int
     is_verified: bool = True
@@ -407,6 +518,15 @@ class CourseReview(CourseReviewBase):
     student_name: Optional[str] = None
     student_avatar: Optional[str] = None
 
+# Pagination Schemas
+class CoursePage(BaseModel):
+    items: List[CourseList]
+    next_cursor: Optional[str] = None
+
+class EnrollmentPage(BaseModel):
+    items: List[Enrollment]
+    next_cursor: Optional[str] = None
+
 # Response Schemas
 class StandardResponse(BaseModel):
     status: str = "success"
@@ -414,7 +534,15 @@ class StandardResponse(BaseModel):
     data: Optional[dict] = None
 
 # Update forward references
-Category.model_rebuild()
+CategoryTreeNode.model_rebuild()
 Module.model_rebuild()
 Lesson.model_rebuild()
-Resource.model_rebuild()
\ No newline at end of file
+Resource.model_rebuild()
+
+# Pre-built adapters for list endpoints: dump_json serializes in
+# pydantic-core directly instead of walking objects through FastAPI's
+# jsonable_encoder.
+CoursePageAdapter = TypeAdapter(CoursePage)
+EnrollmentPageAdapter = TypeAdapter(EnrollmentPage)
+CourseReviewListAdapter = TypeAdapter(List[CourseReview])
+QuizAttemptResponseAdapter = TypeAdapter(List[QuizAttemptResponse])
\ No newline at end of file
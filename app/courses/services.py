@@ -1,18 +1,20 @@
 # app/courses/service.py
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, or_, and_
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy import select, insert, update, delete, func, or_, and_, tuple_, case
+from sqlalchemy.orm import selectinload, joinedload, raiseload
 from fastapi import HTTPException, status
-from typing import List, Optional, Dict, Any
-from datetime import datetime, date
+from typing import List, Optional, Tuple
+from datetime import datetime
+import asyncio
+import re
 import uuid
-import qrcode
-from io import BytesIO
+import segno
 import base64
+import json
 
 from app.courses.models import (
     Category, Tag, Course, Module, Lesson, LessonProgress, Resource,
-    Quiz, Question, Answer, QuizAttempt, QuestionResponse,
+    Quiz, Question, Answer, QuizAttempt, QuizAttemptCounter, QuestionResponse,
     Enrollment, Certificate, CourseReview, course_tags
 )
 from app.courses.schemas import (
@@ -22,35 +24,124 @@ from app.courses.schemas import (
     CourseReviewCreate, QuizSubmission, LessonProgressUpdate
 )
 from app.accounts.models import User
+from app.utils.cache import TTLCache
+
+# Redis is not part of this deployment; the same in-process TTL cache
+# used for auth lookups serves the read-heavy catalog endpoints. Writes
+# invalidate eagerly, and the short TTL bounds staleness across workers.
+_catalog_cache = TTLCache(max_entries=2048)
+_CATEGORY_TTL = 120
+_COURSE_TTL = 60
+
+class _CourseView:
+    """Per-request view over a (possibly cached) Course row.
+
+    The cached instance is shared across requests, so response-only
+    fields (is_enrolled and the computed aggregates) live on this view
+    instead; every other attribute proxies through to the row.
+    """
+    __slots__ = (
+        '_course', 'is_enrolled', 'instructor_name', 'category_name',
+        'enrolled_count', 'average_rating',
+    )
+
+    def __init__(self, course):
+        self._course = course
+        self.is_enrolled = False
+        self.instructor_name = None
+        self.category_name = None
+        self.enrolled_count = 0
+        self.average_rating = 0.0
+
+    def __getattr__(self, name):
+        return getattr(self._course, name)
+
+_SLUG_STRIP_RE = re.compile(r'[^a-z0-9]+')
+
+def _slugify(name: str) -> str:
+    """Build a slug matching the ^[a-z0-9-]+$ shape the API accepts"""
+    slug = _SLUG_STRIP_RE.sub('-', name.lower()).strip('-')
+    return slug or 'tag'
+
+def _encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """Encode a keyset pagination cursor as URL-safe base64"""
+    raw = json.dumps([timestamp.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def _render_qr_png(qr_data: str, path: str) -> None:
+    """Render a QR code PNG to a static file (CPU-bound)"""
+    segno.make(qr_data, error='L', micro=False).save(
+        path, kind='png', scale=10, border=5
+    )
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a keyset pagination cursor"""
+    try:
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 class CourseService:
     
     @staticmethod
     async def create_category(db: AsyncSession, category_data: CategoryCreate) -> Category:
         """Create new category"""
-        category = Category(**category_data.model_dump())
-        db.add(category)
+        # RETURNING folds the INSERT and the default/generated column read
+        # into one round-trip instead of commit + refresh
+        stmt = insert(Category).values(**category_data.model_dump()).returning(Category)
+        category = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(category)
+        _catalog_cache.delete("categories:True")
+        _catalog_cache.delete("categories:False")
         return category
     
     @staticmethod
     async def get_categories(db: AsyncSession, active_only: bool = True) -> List[Category]:
         """Get all categories"""
-        query = select(Category).options(selectinload(Category.subcategories))
+        cache_key = f"categories:{active_only}"
+        cached = _catalog_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        query = select(Category)
         if active_only:
             query = query.where(Category.is_active == True)
         query = query.order_by(Category.order, Category.name)
         
         result = await db.execute(query)
-        return result.scalars().all()
+        categories = result.scalars().all()
+        _catalog_cache.set(cache_key, categories, _CATEGORY_TTL)
+        return categories
+    
+    @staticmethod
+    async def get_category_tree(db: AsyncSession) -> List[dict]:
+        """Build the category tree in Python from one flat query"""
+        result = await db.execute(
+            select(Category)
+            .where(Category.is_active == True)
+            .order_by(Category.order, Category.name)
+        )
+        categories = result.scalars().all()
+        
+        nodes = {
+            c.id: {"id": c.id, "name": c.name, "slug": c.slug, "children": []}
+            for c in categories
+        }
+        roots = []
+        for category in categories:
+            node = nodes[category.id]
+            if category.parent_id and category.parent_id in nodes:
+                nodes[category.parent_id]["children"].append(node)
+            else:
+                roots.append(node)
+        return roots
     
     @staticmethod
     async def get_category_by_slug(db: AsyncSession, slug: str) -> Category:
         """Get category by slug"""
         result = await db.execute(
             select(Category)
-            .options(selectinload(Category.subcategories))
             .where(Category.slug == slug, Category.is_active == True)
         )
         category = result.scalar_one_or_none()
@@ -67,23 +158,23 @@ class CourseService:
         course_dict['instructor_id'] = instructor_id
         
         course = Course(**course_dict)
+        # Assign the collection while the instance is still transient:
+        # after a flush the unloaded collection would lazy-load on
+        # access, which the async session cannot do implicitly. The
+        # upsert, the course INSERT and the association rows still share
+        # a single commit.
+        course.tags = (
+            list(await CourseService._get_or_create_tags(db, tags_data))
+            if tags_data else []
+        )
         db.add(course)
-        await db.commit()
-        await db.refresh(course)
-        
-        # Add tags
-        if tags_data:
-            for tag_name in tags_data:
-                tag = await CourseService._get_or_create_tag(db, tag_name)
-                course.tags.append(tag)
-        
         await db.commit()
         return course
     
     @staticmethod
     async def get_courses(
         db: AsyncSession,
-        skip: int = 0,
+        cursor: Optional[str] = None,
         limit: int = 20,
         category_id: Optional[int] = None,
         level: Optional[str] = None,
@@ -91,12 +182,18 @@ class CourseService:
         instructor_id: Optional[int] = None,
         featured_only: bool = False,
         published_only: bool = True
-    ) -> List[Course]:
-        """Get courses with filtering"""
+    ) -> Tuple[List[Course], Optional[str]]:
+        """Get courses with filtering and keyset pagination"""
+        # selectinload avoids the wide joined result set the ORM would
+        # otherwise have to dedupe row-by-row; the router also reads
+        # enrollments and reviews for the computed fields, so load them
+        # here instead of lazily
         query = select(Course).options(
-            joinedload(Course.instructor),
-            joinedload(Course.category),
-            selectinload(Course.tags)
+            selectinload(Course.instructor),
+            selectinload(Course.category),
+            selectinload(Course.tags),
+            selectinload(Course.enrollments),
+            selectinload(Course.reviews)
         )
         
         if published_only:
@@ -115,22 +212,54 @@ class CourseService:
             query = query.where(Course.is_featured == True)
         
         if search:
-            query = query.where(
-                or_(
-                    Course.title.ilike(f"%{search}%"),
-                    Course.description.ilike(f"%{search}%"),
-                    Course.short_description.ilike(f"%{search}%")
+            if db.bind.dialect.name == "postgresql":
+                # Full-text search hits the GIN index (ix_courses_fts)
+                # instead of sequential-scanning three ILIKE patterns
+                document = func.to_tsvector(
+                    'english',
+                    func.concat_ws(' ', Course.title, Course.short_description, Course.description)
+                )
+                ts_query = func.plainto_tsquery('english', search)
+                # Rank ordering would break the (created_at, id) cursor
+                # below, so searched pages keep the recency sort and the
+                # GIN index does the narrowing
+                query = query.where(document.op('@@')(ts_query))
+            else:
+                query = query.where(
+                    or_(
+                        Course.title.ilike(f"%{search}%"),
+                        Course.description.ilike(f"%{search}%"),
+                        Course.short_description.ilike(f"%{search}%")
+                    )
                 )
+        
+        # Keyset pagination: constant cost per page, unlike OFFSET which
+        # scans and discards every previous row
+        if cursor:
+            created_at, course_id = _decode_cursor(cursor)
+            query = query.where(
+                tuple_(Course.created_at, Course.id) < (created_at, course_id)
             )
         
-        query = query.order_by(Course.created_at.desc()).offset(skip).limit(limit)
+        query = query.order_by(Course.created_at.desc(), Course.id.desc()).limit(limit + 1)
         
         result = await db.execute(query)
-        return result.scalars().all()
+        courses = result.scalars().all()
+        
+        next_cursor = None
+        if len(courses) > limit:
+            courses = courses[:limit]
+            next_cursor = _encode_cursor(courses[-1].created_at, courses[-1].id)
+        
+        return courses, next_cursor
     
     @staticmethod
     async def get_course_by_uuid(db: AsyncSession, uuid: str, user_id: Optional[int] = None) -> Course:
         """Get course by UUID with all details"""
+        course = _catalog_cache.get(f"course:{uuid}")
+        if course is not None:
+            return await CourseService._with_enrollment_flag(db, _CourseView(course), user_id)
+
         result = await db.execute(
             select(Course)
             .options(
@@ -138,8 +267,14 @@ class CourseService:
                 selectinload(Course.co_instructors),
                 joinedload(Course.category),
                 selectinload(Course.tags),
-                selectinload(Course.modules).selectinload(Module.lessons),
-                selectinload(Course.reviews).joinedload(CourseReview.student)
+                selectinload(Course.enrollments),
+                selectinload(Course.modules)
+                .selectinload(Module.lessons)
+                .selectinload(Lesson.resources),
+                selectinload(Course.reviews).joinedload(CourseReview.student),
+                # Fail fast on any relation we forgot to prefetch instead
+                # of emitting stealth lazy-load queries
+                raiseload("*")
             )
             .where(Course.uuid == uuid)
         )
@@ -147,20 +282,26 @@ class CourseService:
         if not course:
             raise HTTPException(status_code=404, detail="Course not found")
         
-        # Check if user is enrolled
+        _catalog_cache.set(f"course:{uuid}", course, _COURSE_TTL)
+        return await CourseService._with_enrollment_flag(db, _CourseView(course), user_id)
+
+    @staticmethod
+    async def _with_enrollment_flag(
+        db: AsyncSession, view: '_CourseView', user_id: Optional[int]
+    ) -> '_CourseView':
+        """Attach is_enrolled to the per-request view; never to the row"""
         if user_id:
             enrollment_result = await db.execute(
                 select(Enrollment).where(
                     and_(
-                        Enrollment.course_id == course.id,
+                        Enrollment.course_id == view.id,
                         Enrollment.student_id == user_id,
                         Enrollment.is_active == True
                     )
                 )
             )
-            course.is_enrolled = enrollment_result.scalar_one_or_none() is not None
-        
-        return course
+            view.is_enrolled = enrollment_result.scalar_one_or_none() is not None
+        return view
     
     @staticmethod
     async def update_course(
@@ -169,28 +310,41 @@ class CourseService:
         course_data: CourseUpdate
     ) -> Course:
         """Update course"""
-        course = await CourseService._get_course_by_id(db, course_id)
-        
-        # Handle tags
-        tags_data = course_data.tags if hasattr(course_data, 'tags') else None
+        # Eager-load tags: replacing the collection below would otherwise
+        # lazy-load it, which the async session cannot do implicitly
+        result = await db.execute(
+            select(Course)
+            .options(selectinload(Course.tags))
+            .where(Course.id == course_id)
+        )
+        course = result.scalar_one_or_none()
+        if not course:
+            raise HTTPException(status_code=404, detail="Course not found")
+
+        # Handle tags; the default [] must not wipe existing tags, so only
+        # a tags list the caller actually sent counts as provided
+        tags_data = (
+            course_data.tags if 'tags' in course_data.model_fields_set else None
+        )
         update_dict = course_data.model_dump(exclude={'tags'}, exclude_unset=True)
-        
+
         if update_dict:
             await db.execute(
                 update(Course).where(Course.id == course_id).values(**update_dict)
             )
-        
+
         # Update tags if provided
         if tags_data is not None:
-            # Clear existing tags
-            course.tags.clear()
-            # Add new tags
-            for tag_name in tags_data:
-                tag = await CourseService._get_or_create_tag(db, tag_name)
-                course.tags.append(tag)
+            course.tags = list(
+                await CourseService._get_or_create_tags(db, tags_data)
+            )
         
         await db.commit()
         await db.refresh(course)
+        # refresh expires the collection; reload it here so returning the
+        # course never falls back to an implicit lazy-load
+        await db.refresh(course, attribute_names=['tags'])
+        _catalog_cache.delete(f"course:{course.uuid}")
         return course
     
     @staticmethod
@@ -222,48 +376,66 @@ class CourseService:
             if current_count.scalar() >= course.enrollment_limit:
                 raise HTTPException(status_code=400, detail="Course enrollment limit reached")
         
-        enrollment = Enrollment(student_id=user_id, course_id=course_id)
-        db.add(enrollment)
+        stmt = (
+            insert(Enrollment)
+            .values(student_id=user_id, course_id=course_id)
+            .returning(Enrollment)
+        )
+        enrollment = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(enrollment)
         return enrollment
     
     @staticmethod
     async def get_user_enrollments(
         db: AsyncSession, 
         user_id: int,
-        status: Optional[str] = None
-    ) -> List[Enrollment]:
-        """Get user enrollments"""
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 20
+    ) -> Tuple[List[Enrollment], Optional[str]]:
+        """Get user enrollments with keyset pagination"""
         query = select(Enrollment).options(
-            joinedload(Enrollment.course).joinedload(Course.instructor),
-            joinedload(Enrollment.course).joinedload(Course.category)
+            selectinload(Enrollment.course).options(
+                selectinload(Course.instructor),
+                selectinload(Course.category)
+            )
         ).where(Enrollment.student_id == user_id, Enrollment.is_active == True)
         
         if status:
             query = query.where(Enrollment.status == status)
         
-        query = query.order_by(Enrollment.enrolled_at.desc())
+        if cursor:
+            enrolled_at, enrollment_id = _decode_cursor(cursor)
+            query = query.where(
+                tuple_(Enrollment.enrolled_at, Enrollment.id) < (enrolled_at, enrollment_id)
+            )
+        
+        query = query.order_by(Enrollment.enrolled_at.desc(), Enrollment.id.desc()).limit(limit + 1)
         
         result = await db.execute(query)
-        return result.scalars().all()
+        enrollments = result.scalars().all()
+        
+        next_cursor = None
+        if len(enrollments) > limit:
+            enrollments = enrollments[:limit]
+            next_cursor = _encode_cursor(enrollments[-1].enrolled_at, enrollments[-1].id)
+        
+        return enrollments, next_cursor
     
     @staticmethod
     async def create_module(db: AsyncSession, module_data: ModuleCreate) -> Module:
         """Create course module"""
-        module = Module(**module_data.model_dump())
-        db.add(module)
+        stmt = insert(Module).values(**module_data.model_dump()).returning(Module)
+        module = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(module)
         return module
     
     @staticmethod
     async def create_lesson(db: AsyncSession, lesson_data: LessonCreate) -> Lesson:
         """Create lesson"""
-        lesson = Lesson(**lesson_data.model_dump())
-        db.add(lesson)
+        stmt = insert(Lesson).values(**lesson_data.model_dump()).returning(Lesson)
+        lesson = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(lesson)
         return lesson
     
     @staticmethod
@@ -291,8 +463,13 @@ class CourseService:
         completed: bool = False
     ) -> LessonProgress:
         """Update lesson progress"""
-        # Get enrollment
-        lesson = await db.execute(select(Lesson).where(Lesson.id == lesson_id))
+        # Get enrollment; the module must be loaded eagerly since
+        # lesson.module.course_id is read below
+        lesson = await db.execute(
+            select(Lesson)
+            .options(joinedload(Lesson.module), raiseload("*"))
+            .where(Lesson.id == lesson_id)
+        )
         lesson = lesson.scalar_one()
         
         enrollment = await db.execute(
@@ -307,49 +484,126 @@ class CourseService:
         enrollment = enrollment.scalar_one_or_none()
         if not enrollment:
             raise HTTPException(status_code=404, detail="Enrollment not found")
-        
-        # Get or create progress
-        progress_result = await db.execute(
-            select(LessonProgress).where(
+
+        # Upsert progress in one statement instead of SELECT + INSERT/UPDATE;
+        # the unique constraint on (enrollment_id, lesson_id) anchors the
+        # conflict target
+        values = progress_data.model_dump(exclude_unset=True)
+        values.update(enrollment_id=enrollment.id, lesson_id=lesson_id)
+        if completed:
+            values.update(is_completed=True, completed_at=datetime.utcnow())
+
+        if db.bind.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        set_ = {
+            k: v for k, v in values.items()
+            if k not in ("enrollment_id", "lesson_id")
+        }
+        if completed:
+            # Keep the first completion timestamp on repeat submissions
+            set_["completed_at"] = func.coalesce(
+                LessonProgress.completed_at, values["completed_at"]
+            )
+        stmt = (
+            dialect_insert(LessonProgress)
+            .values(**values)
+            .returning(LessonProgress)
+        )
+        if set_:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["enrollment_id", "lesson_id"], set_=set_
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=["enrollment_id", "lesson_id"]
+            )
+        progress = (await db.execute(stmt)).scalar_one_or_none()
+        if progress is None:
+            progress = (await db.execute(
+                select(LessonProgress).where(
+                    and_(
+                        LessonProgress.enrollment_id == enrollment.id,
+                        LessonProgress.lesson_id == lesson_id
+                    )
+                )
+            )).scalar_one()
+
+        # Recompute progress_percentage and status transitions in a single
+        # UPDATE driven by scalar subqueries, then commit both writes at once
+        total_sq = (
+            select(func.count(Lesson.id))
+            .select_from(Module)
+            .join(Lesson, Lesson.module_id == Module.id)
+            .where(
+                and_(
+                    Module.course_id == enrollment.course_id,
+                    Lesson.is_published == True,
+                    Module.is_published == True
+                )
+            )
+            .scalar_subquery()
+        )
+        done_sq = (
+            select(func.count(LessonProgress.id))
+            .select_from(Module)
+            .join(Lesson, Lesson.module_id == Module.id)
+            .join(
+                LessonProgress,
                 and_(
+                    LessonProgress.lesson_id == Lesson.id,
                     LessonProgress.enrollment_id == enrollment.id,
-                    LessonProgress.lesson_id == lesson_id
+                    LessonProgress.is_completed == True
+                )
+            )
+            .where(
+                and_(
+                    Module.course_id == enrollment.course_id,
+                    Lesson.is_published == True,
+                    Module.is_published == True
                 )
             )
+            .scalar_subquery()
         )
-        progress = progress_result.scalar_one_or_none()
-        
-        if not progress:
-            progress = LessonProgress(
-                enrollment_id=enrollment.id,
-                lesson_id=lesson_id
+        pct = done_sq * 100.0 / func.nullif(total_sq, 0)
+        await db.execute(
+            update(Enrollment)
+            .where(Enrollment.id == enrollment.id)
+            .values(
+                progress_percentage=func.coalesce(pct, 0),
+                status=case(
+                    (pct >= 100, "completed"),
+                    (and_(pct > 0, Enrollment.status == "enrolled"), "in_progress"),
+                    else_=Enrollment.status
+                ),
+                completed_at=case(
+                    (
+                        and_(pct >= 100, Enrollment.status != "completed"),
+                        datetime.utcnow()
+                    ),
+                    else_=Enrollment.completed_at
+                ),
+                started_at=case(
+                    (
+                        and_(pct > 0, Enrollment.status == "enrolled"),
+                        datetime.utcnow()
+                    ),
+                    else_=Enrollment.started_at
+                )
             )
-            db.add(progress)
-        
-        # Update progress
-        update_dict = progress_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(progress, field, value)
-        
-        if completed and not progress.is_completed:
-            progress.is_completed = True
-            progress.completed_at = datetime.utcnow()
-        
+        )
         await db.commit()
-        await db.refresh(progress)
-        
-        # Update enrollment progress
-        await CourseService._update_enrollment_progress(db, enrollment.id)
-        
+
         return progress
     
     @staticmethod
     async def create_quiz(db: AsyncSession, quiz_data: QuizCreate) -> Quiz:
         """Create quiz"""
-        quiz = Quiz(**quiz_data.model_dump())
-        db.add(quiz)
+        stmt = insert(Quiz).values(**quiz_data.model_dump()).returning(Quiz)
+        quiz = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(quiz)
         return quiz
     
     @staticmethod
@@ -375,16 +629,25 @@ class CourseService:
         if not enrollment:
             raise HTTPException(status_code=404, detail="Enrollment not found")
         
-        # Check attempt limit
-        attempt_count = await db.execute(
-            select(func.count(QuizAttempt.id)).where(
-                and_(
-                    QuizAttempt.quiz_id == quiz.id,
-                    QuizAttempt.student_id == user_id
-                )
+        # Check attempt limit via an atomic counter increment instead of
+        # aggregating the ever-growing attempt history; RETURNING hands
+        # back the new attempt number in the same round-trip. Raising
+        # before commit rolls the increment back.
+        if db.bind.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        
+        attempt_number = (await db.execute(
+            dialect_insert(QuizAttemptCounter)
+            .values(quiz_id=quiz.id, student_id=user_id, attempts_used=1)
+            .on_conflict_do_update(
+                index_elements=["quiz_id", "student_id"],
+                set_={"attempts_used": QuizAttemptCounter.attempts_used + 1}
             )
-        )
-        if attempt_count.scalar() >= quiz.max_attempts:
+            .returning(QuizAttemptCounter.attempts_used)
+        )).scalar_one()
+        if attempt_number > quiz.max_attempts:
             raise HTTPException(status_code=400, detail="Maximum attempts exceeded")
         
         # Create attempt
@@ -392,24 +655,32 @@ class CourseService:
             quiz_id=quiz.id,
             student_id=user_id,
             enrollment_id=enrollment.id,
-            attempt_number=attempt_count.scalar() + 1
+            attempt_number=attempt_number
         )
         db.add(attempt)
-        await db.commit()
-        await db.refresh(attempt)
-        
+        # flush assigns the attempt PK for the responses below; grading
+        # and responses then commit atomically with the attempt
+        await db.flush()
+        
+        # Fetch all referenced questions with their answers in one query
+        # instead of one round-trip per response
+        question_ids = [r.question_id for r in quiz_submission.responses]
+        questions_result = await db.execute(
+            select(Question)
+            .options(selectinload(Question.answers))
+            .where(Question.id.in_(question_ids))
+        )
+        question_map = {q.id: q for q in questions_result.scalars().all()}
+
         # Process responses and calculate score
         total_points = 0
         earned_points = 0
-        
+
         for response_data in quiz_submission.responses:
-            question = await db.execute(
-                select(Question)
-                .options(selectinload(Question.answers))
-                .where(Question.id == response_data.question_id)
-            )
-            question = question.scalar_one()
-            
+            question = question_map.get(response_data.question_id)
+            if not question:
+                raise HTTPException(status_code=400, detail="Invalid question in submission")
+
             response = QuestionResponse(
                 attempt_id=attempt.id,
                 question_id=question.id,
@@ -446,7 +717,6 @@ class CourseService:
         attempt.passed = passed
         
         await db.commit()
-        await db.refresh(attempt)
         return attempt
     
     @staticmethod
@@ -484,13 +754,13 @@ class CourseService:
         if existing.scalar_one_or_none():
             raise HTTPException(status_code=400, detail="Already reviewed this course")
         
-        review = CourseReview(
-            student_id=user_id,
-            **review_data.model_dump()
+        stmt = (
+            insert(CourseReview)
+            .values(student_id=user_id, **review_data.model_dump())
+            .returning(CourseReview)
         )
-        db.add(review)
+        review = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(review)
         return review
     
     @staticmethod
@@ -500,7 +770,8 @@ class CourseService:
             select(Enrollment)
             .options(
                 joinedload(Enrollment.student),
-                joinedload(Enrollment.course)
+                joinedload(Enrollment.course),
+                raiseload("*")
             )
             .where(Enrollment.id == enrollment_id)
         )
@@ -532,21 +803,20 @@ class CourseService:
         )
         
         db.add(certificate)
-        await db.commit()
-        await db.refresh(certificate)
-        
-        # Generate QR code
+        # flush assigns the uuid the QR path is derived from; the row and
+        # its QR URL then commit together
+        await db.flush()
+        
+        # Generate QR code off the event loop; encoding the PNG is pure
+        # CPU and would otherwise stall every other in-flight request.
+        # The image lives under /static so responses carry a URL instead
+        # of a ~4KB base64 blob per certificate row
         qr_data = f"VERIFY:{cert_number}"
-        qr = qrcode.QRCode(version=1, box_size=10, border=5)
-        qr.add_data(qr_data)
-        qr.make(fit=True)
-        
-        qr_img = qr.make_image(fill_color="black", back_color="white")
-        qr_buffer = BytesIO()
-        qr_img.save(qr_buffer, format='PNG')
-        qr_b64 = base64.b64encode(qr_buffer.getvalue()).decode()
-        
-        certificate.qr_code = f"data:image/png;base64,{qr_b64}"
+        await asyncio.to_thread(
+            _render_qr_png, qr_data, f"app/static/qr/{certificate.uuid}.png"
+        )
+
+        certificate.qr_code = f"/static/qr/{certificate.uuid}.png"
         certificate.verification_url = f"/certificates/{certificate.uuid}/verify"
         
         await db.commit()
@@ -567,7 +837,10 @@ class CourseService:
         """Get quiz by ID"""
         result = await db.execute(
             select(Quiz)
-            .options(selectinload(Quiz.questions).selectinload(Question.answers))
+            .options(
+                selectinload(Quiz.questions).selectinload(Question.answers),
+                raiseload("*")
+            )
             .where(Quiz.id == quiz_id)
         )
         quiz = result.scalar_one_or_none()
@@ -576,77 +849,26 @@ class CourseService:
         return quiz
     
     @staticmethod
-    async def _get_or_create_tag(db: AsyncSession, tag_name: str) -> Tag:
-        """Get or create tag"""
-        slug = tag_name.lower().replace(' ', '-')
-        result = await db.execute(select(Tag).where(Tag.slug == slug))
-        tag = result.scalar_one_or_none()
-        
-        if not tag:
-            tag = Tag(name=tag_name, slug=slug)
-            db.add(tag)
-            await db.commit()
-            await db.refresh(tag)
-        
-        return tag
-    
-    @staticmethod
-    async def _update_enrollment_progress(db: AsyncSession, enrollment_id: int):
-        """Update enrollment progress percentage"""
-        # Get total lessons and completed lessons
-        enrollment = await db.execute(
-            select(Enrollment)
-            .options(joinedload(Enrollment.course))
-            .where(Enrollment.id == enrollment_id)
-        )
-        enrollment = enrollment.scalar_one()
-        
-        total_lessons = await db.execute(
-            select(func.count(Lesson.id))
-            .join(Module)
-            .where(
-                and_(
-                    Module.course_id == enrollment.course_id,
-                    Lesson.is_published == True,
-                    Module.is_published == True
-                )
-            )
-        )
-        total_lessons = total_lessons.scalar()
-        
-        if total_lessons == 0:
-            return
-        
-        completed_lessons = await db.execute(
-            select(func.count(LessonProgress.id))
-            .join(Lesson).join(Module)
-            .where(
-                and_(
-                    LessonProgress.enrollment_id == enrollment_id,
-                    LessonProgress.is_completed == True,
-                    Module.course_id == enrollment.course_id,
-                    Lesson.is_published == True,
-                    Module.is_published == True
-                )
-            )
-        )
-        completed_lessons = completed_lessons.scalar()
-        
-        progress = (completed_lessons / total_lessons) * 100
-        
-        # Update enrollment
-        update_data = {"progress_percentage": progress}
-        
-        if progress >= 100 and enrollment.status != "completed":
-            update_data["status"] = "completed"
-            update_data["completed_at"] = datetime.utcnow()
-        elif progress > 0 and enrollment.status == "enrolled":
-            update_data["status"] = "in_progress"
-            update_data["started_at"] = datetime.utcnow()
+    async def _get_or_create_tags(db: AsyncSession, tag_names: List[str]) -> List[Tag]:
+        """Upsert tags in bulk: one INSERT ... ON CONFLICT plus one SELECT"""
+        rows = [
+            {"name": name, "slug": _slugify(name)}
+            for name in tag_names
+        ]
+        if not rows:
+            return []
+        
+        if db.bind.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
         
         await db.execute(
-            update(Enrollment)
-            .where(Enrollment.id == enrollment_id)
-            .values(**update_data)
+            dialect_insert(Tag)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=['slug'])
+        )
+        result = await db.execute(
+            select(Tag).where(Tag.slug.in_([row['slug'] for row in rows]))
         )
-        await db.commit()
\ No newline at end of file
+        return result.scalars().all()
@@ -5,11 +5,32 @@ from sqlalchemy.orm import DeclarativeBase
 from app.config import settings
 
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
+# Explicit pool sizing only applies to server databases; the sqlite dev
+# database keeps SQLAlchemy's defaults. pool_use_lifo keeps a small hot
+# set of connections warm, pool_pre_ping drops stale ones.
+engine_kwargs = dict(
     echo=settings.DEBUG,
     future=True
 )
+if not settings.DATABASE_URL.startswith("sqlite"):
+    engine_kwargs.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_use_lifo=True,
+        # asyncpg prepared-statement cache skips repeated parse/bind for
+        # recurring query shapes; query_cache_size widens SQLAlchemy's
+        # compiled-SQL cache to match. Set both driver caches to 0 if a
+        # transaction-mode pgbouncer ever fronts this database.
+        connect_args={
+            "prepared_statement_cache_size": 500,
+            "statement_cache_size": 500
+        },
+        query_cache_size=1200
+    )
+
+engine = create_async_engine(settings.DATABASE_URL, **engine_kwargs)
 
 # Create session factory
 async_session_maker = async_sessionmaker(
@@ -30,7 +51,8 @@ async def get_db():
         finally:
             await session.close()
 
-# Create tables
+# Create tables (dev/test helper only; production schema is managed by
+# Alembic migrations and must not run DDL on worker startup)
 async def create_tables():
     async with engine.begin() as conn:
         # Import all models to ensure they're registered
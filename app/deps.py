@@ -3,36 +3,61 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+import time
 import jwt
 
 from app.database import get_db
 from app.config import settings
 from app.accounts.models import User
+from app.utils.cache import TTLCache
 
 security = HTTPBearer()
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """Get current authenticated user"""
+# Memo of user id -> resolved user so hot authenticated endpoints skip
+# the per-request SELECT. Keying by id (not token) means one entry per
+# user regardless of how many tokens they hold, and invalidation is a
+# single delete. Entries live for the token's remaining lifetime, capped
+# at five minutes so role/verification changes converge quickly.
+_USER_CACHE_TTL = 300
+_user_cache = TTLCache(max_entries=4096)
+
+def invalidate_user_cache(user_id: int) -> None:
+    """Drop the cached auth entry after a role/verification/profile change"""
+    _user_cache.delete(f"u:{user_id}")
+
+async def get_token_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> dict:
+    """Decode and validate the bearer token without touching the database"""
     try:
         payload = jwt.decode(
             credentials.credentials,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
-        user_id: int = payload.get("sub")
-        if user_id is None:
+        if payload.get("sub") is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid authentication credentials"
             )
+        return payload
     except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials"
         )
+
+async def get_current_user(
+    payload: dict = Depends(get_token_claims),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Get current authenticated user"""
+    user_id: int = payload.get("sub")
+
+    cache_key = f"u:{user_id}"
+    user = _user_cache.get(cache_key)
+    if user is not None:
+        return user
     
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
@@ -43,13 +68,25 @@ async def get_current_user(
             detail="User not found"
         )
     
+    ttl = _USER_CACHE_TTL
+    exp = payload.get("exp")
+    if exp:
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        _user_cache.set(cache_key, user, ttl)
+
     return user
 
+# The role dependencies read the claims embedded at login so the checks
+# cost no extra query; user fields remain the fallback for tokens issued
+# before the claims were added.
+
 async def get_verified_user(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    claims: dict = Depends(get_token_claims)
 ) -> User:
     """Get current verified user"""
-    if not current_user.is_verified:
+    if not claims.get("verified", current_user.is_verified):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Email verification required"
@@ -57,10 +94,13 @@ async def get_verified_user(
     return current_user
 
 async def get_teacher_user(
-    current_user: User = Depends(get_verified_user)
+    current_user: User = Depends(get_verified_user),
+    claims: dict = Depends(get_token_claims)
 ) -> User:
     """Get current user if they are a teacher or admin"""
-    if current_user.role not in ["teacher", "moderator", "manager"] and not current_user.is_staff:
+    role = claims.get("role", current_user.role)
+    is_staff = claims.get("staff", current_user.is_staff)
+    if role not in ["teacher", "moderator", "manager"] and not is_staff:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Teacher access required"
@@ -68,10 +108,13 @@ async def get_teacher_user(
     return current_user
 
 async def get_manager_user(
-    current_user: User = Depends(get_verified_user)
+    current_user: User = Depends(get_verified_user),
+    claims: dict = Depends(get_token_claims)
 ) -> User:
     """Get current user if they are a manager or admin"""
-    if current_user.role not in ["manager"] and not current_user.is_staff:
+    role = claims.get("role", current_user.role)
+    is_staff = claims.get("staff", current_user.is_staff)
+    if role not in ["manager"] and not is_staff:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Manager access required"
@@ -79,10 +122,13 @@ async def get_manager_user(
     return current_user
 
 async def get_moderator_user(
-    current_user: User = Depends(get_verified_user)
+    current_user: User = Depends(get_verified_user),
+    claims: dict = Depends(get_token_claims)
 ) -> User:
     """Get current user if they are a moderator or above"""
-    if current_user.role not in ["moderator", "manager"] and not current_user.is_staff:
+    role = claims.get("role", current_user.role)
+    is_staff = claims.get("staff", current_user.is_staff)
+    if role not in ["moderator", "manager"] and not is_staff:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Moderator access required"
@@ -1,13 +1,17 @@
 # app/main.py
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+from sqlalchemy import text
 import logging
 
 from app.config import settings
-from app.database import engine, create_tables
+from app.database import engine
+from app.utils.email import close_smtp, start_mail_workers, stop_mail_workers
 from app.accounts.router import router as accounts_router
 from app.courses.router import router as courses_router
 from app.core.router import router as core_router
@@ -18,11 +22,16 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
-    await create_tables()
+    # Startup. Schema changes are applied via `alembic upgrade head` at
+    # deploy time, not per worker; just warm the connection pool here.
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    start_mail_workers()
     logger.info("Application startup complete")
     yield
     # Shutdown
+    await stop_mail_workers()
+    await close_smtp()
     logger.info("Application shutdown")
 
 # Create FastAPI application
@@ -32,9 +41,13 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Compress the wide list payloads over the wire
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
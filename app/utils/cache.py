@@ -0,0 +1,43 @@
+# app/utils/cache.py
+import time
+from typing import Any, Dict, Optional, Tuple
+
+class TTLCache:
+    """Minimal in-process TTL cache.
+
+    Process-local stand-in for a shared cache: entries expire lazily on
+    access and the store is bounded by max_entries.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._store: Dict[str, Tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._store.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        if len(self._store) >= self.max_entries:
+            self._prune()
+        self._store[key] = (time.monotonic() + ttl, value)
+
+    def delete(self, key: str) -> None:
+        self._store.pop(key, None)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def _prune(self) -> None:
+        """Drop expired entries; clear everything if still over the cap"""
+        now = time.monotonic()
+        for key in [k for k, (exp, _) in self._store.items() if exp <= now]:
+            self._store.pop(key, None)
+        if len(self._store) >= self.max_entries:
+            self._store.clear()
@@ -1,17 +1,146 @@
 # app/utils/email.py
 import aiosmtplib
+from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from markupsafe import escape
+from functools import lru_cache
+import asyncio
 import logging
+import re
+import time
 from typing import Dict, Any, Optional
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Setup Jinja2 environment for email templates
-template_env = Environment(loader=FileSystemLoader("app/templates"))
+# Compiled once; strips tags for the text fallback of HTML-only templates
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# URL prefixes resolved once; %-formatting per send is cheaper than
+# rebuilding the whole URL through an f-string
+_VERIFY_URL = settings.FRONTEND_URL + "/verify-email?code=%s&email=%s"
+_RESET_URL = settings.FRONTEND_URL + "/reset-password?code=%s&email=%s"
+
+# Template context shared by every message, built once at import;
+# current_year is refreshed at most hourly instead of hitting the clock
+# syscall per send
+_COMMON = {
+    'company_name': settings.COMPANY_NAME,
+    'frontend_url': settings.FRONTEND_URL,
+}
+_YEAR_CACHE = [datetime.now().year, time.monotonic()]
+
+def _year() -> int:
+    if time.monotonic() - _YEAR_CACHE[1] > 3600:
+        _YEAR_CACHE[:] = [datetime.now().year, time.monotonic()]
+    return _YEAR_CACHE[0]
+
+# Persistent SMTP connection shared across sends; one TLS+AUTH handshake
+# is amortized over many messages instead of paid per email.
+_smtp: Optional[aiosmtplib.SMTP] = None
+_smtp_lock = asyncio.Lock()
+
+async def _get_smtp() -> aiosmtplib.SMTP:
+    """Return the shared connected SMTP client, dialing if needed"""
+    global _smtp
+    if _smtp is None or not _smtp.is_connected:
+        _smtp = aiosmtplib.SMTP(
+            hostname=settings.EMAIL_HOST,
+            port=settings.EMAIL_PORT,
+            start_tls=settings.EMAIL_USE_TLS,
+            username=settings.EMAIL_HOST_USER,
+            password=settings.EMAIL_HOST_PASSWORD,
+        )
+        await _smtp.connect()
+    return _smtp
+
+async def close_smtp() -> None:
+    """Close the shared SMTP connection (called on app shutdown)"""
+    global _smtp
+    async with _smtp_lock:
+        if _smtp is not None and _smtp.is_connected:
+            await _smtp.quit()
+        _smtp = None
+
+# Setup Jinja2 environment for email templates. Templates never change
+# at runtime, so auto_reload=False skips the per-render mtime stat.
+template_env = Environment(
+    loader=FileSystemLoader("app/templates"),
+    auto_reload=False,
+    cache_size=1000,
+    trim_blocks=True,
+    lstrip_blocks=True
+)
+
+# Templates that carry a <!--DYNAMIC--> marker are rendered once per
+# hour into a static prefix/suffix; per-send work collapses to building
+# the small dynamic middle and two concatenations.
+_DYNAMIC_SNIPPETS = {
+    'welcome_email': lambda ctx: "<h2>Hello %s!</h2>" % escape(ctx.get('user_name', '')),
+}
+_SPLIT_MARKER = "<!--DYNAMIC-->"
+_split_cache: Dict[str, tuple] = {}
+
+def _get_static_split(template_name: str):
+    """Return the pre-rendered (preamble, tail) for marker-split templates"""
+    if template_name not in _DYNAMIC_SNIPPETS:
+        return None
+    year = _year()
+    cached = _split_cache.get(template_name)
+    if cached is not None and cached[0] == year:
+        return cached[1], cached[2]
+    html_template, _ = _get_templates(template_name)
+    rendered = html_template.render(**_COMMON, current_year=year)
+    if _SPLIT_MARKER not in rendered:
+        return None
+    preamble, tail = rendered.split(_SPLIT_MARKER, 1)
+    _split_cache[template_name] = (year, preamble, tail)
+    return preamble, tail
+
+@lru_cache(maxsize=64)
+def _get_templates(template_name: str):
+    """Resolve the HTML template and optional text sibling once per name"""
+    html_template = template_env.get_template(f"emails/{template_name}.html")
+    try:
+        text_template = template_env.get_template(f"emails/{template_name}.txt")
+    except TemplateNotFound:
+        # Missing text template is cached as None so the lookup isn't
+        # retried on every send
+        text_template = None
+    return html_template, text_template
+
+# Outbound mail queue drained by background workers started from the app
+# lifespan; request paths enqueue and return without waiting on SMTP.
+_mail_queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+_mail_workers: list = []
+
+async def _mail_worker() -> None:
+    """Drain the mail queue over the shared SMTP connection"""
+    while True:
+        job = await _mail_queue.get()
+        try:
+            await send_email_now(**job)
+        except Exception as e:
+            logger.error(f"Mail worker failed to send to {job.get('to_email')}: {str(e)}")
+        finally:
+            _mail_queue.task_done()
+
+def start_mail_workers(count: int = 2) -> None:
+    """Spawn the mail worker tasks (called on app startup)"""
+    for _ in range(count):
+        _mail_workers.append(asyncio.create_task(_mail_worker()))
+
+async def stop_mail_workers() -> None:
+    """Flush the queue and cancel the workers (called on app shutdown)"""
+    if not _mail_workers:
+        return
+    await _mail_queue.join()
+    for worker in _mail_workers:
+        worker.cancel()
+    _mail_workers.clear()
 
 async def send_email(
     to_email: str,
@@ -19,6 +148,41 @@ async def send_email(
     template_name: str,
     context: Dict[str, Any],
     fail_silently: bool = True
+) -> bool:
+    """Queue an email for background delivery
+
+    Falls back to sending inline when the workers are not running (tests,
+    scripts outside the app lifespan).
+    """
+    if not _mail_workers:
+        return await send_email_now(
+            to_email=to_email,
+            subject=subject,
+            template_name=template_name,
+            context=context,
+            fail_silently=fail_silently
+        )
+    try:
+        _mail_queue.put_nowait({
+            "to_email": to_email,
+            "subject": subject,
+            "template_name": template_name,
+            "context": context,
+            "fail_silently": fail_silently
+        })
+        return True
+    except asyncio.QueueFull:
+        logger.error(f"Mail queue full, dropping email to {to_email}")
+        if not fail_silently:
+            raise
+        return False
+
+async def send_email_now(
+    to_email: str,
+    subject: str,
+    template_name: str,
+    context: Dict[str, Any],
+    fail_silently: bool = True
 ) -> bool:
     """Send email using template"""
     try:
@@ -31,25 +195,24 @@ async def send_email(
                 logger.info(f"RESET CODE: {context.get('reset_code')}")
             return True
         
-        # Add common context
-        context.update({
-            'company_name': settings.COMPANY_NAME,
-            'frontend_url': settings.FRONTEND_URL,
-            'current_year': datetime.now().year,
-        })
+        # Merge the common context without mutating the caller's dict
+        render_ctx = {**_COMMON, 'current_year': _year(), **context}
         
-        # Render email template
-        template = template_env.get_template(f"emails/{template_name}.html")
-        html_content = template.render(**context)
+        # Render email template; marker-split templates reuse their
+        # pre-rendered static parts and only build the dynamic middle
+        html_template, text_template = _get_templates(template_name)
+        split = _get_static_split(template_name)
+        if split is not None:
+            preamble, tail = split
+            html_content = preamble + _DYNAMIC_SNIPPETS[template_name](render_ctx) + tail
+        else:
+            html_content = html_template.render(**render_ctx)
         
-        # Try to get text template
-        try:
-            text_template = template_env.get_template(f"emails/{template_name}.txt")
-            text_content = text_template.render(**context)
-        except:
+        if text_template is not None:
+            text_content = text_template.render(**render_ctx)
+        else:
             # Fallback to HTML stripped of tags
-            import re
-            text_content = re.sub(r'<[^>]+>', '', html_content)
+            text_content = _TAG_RE.sub('', html_content)
         
         # Create message
         message = MIMEMultipart("alternative")
@@ -63,24 +226,94 @@ async def send_email(
         message.attach(text_part)
         message.attach(html_part)
         
-        # Send email
-        await aiosmtplib.send(
-            message,
-            hostname=settings.EMAIL_HOST,
-            port=settings.EMAIL_PORT,
-            start_tls=settings.EMAIL_USE_TLS,
-            username=settings.EMAIL_HOST_USER,
-            password=settings.EMAIL_HOST_PASSWORD,
-        )
+        # Send over the shared connection, redialing once if the server
+        # dropped it between sends
+        async with _smtp_lock:
+            try:
+                smtp = await _get_smtp()
+                await smtp.send_message(message)
+            except (aiosmtplib.SMTPServerDisconnected, ConnectionError):
+                global _smtp
+                _smtp = None
+                smtp = await _get_smtp()
+                await smtp.send_message(message)
         
         logger.info(f"Email sent: {subject} to {to_email}")
         return True
         
-    except Exception as e:
+    except (aiosmtplib.SMTPException, ConnectionError, OSError, TemplateNotFound) as e:
         logger.error(f"Failed to send email to {to_email}: {str(e)}")
         if not fail_silently:
             raise
         return False
+    except Exception:
+        # Unknown failure: log the traceback instead of swallowing it
+        logger.exception(f"Unexpected error sending email to {to_email}")
+        if not fail_silently:
+            raise
+        return False
+
+async def send_bulk_email(
+    to_emails: list,
+    subject: str,
+    template_name: str,
+    context: Dict[str, Any],
+    fail_silently: bool = True
+) -> bool:
+    """Send one rendered message to many recipients over a single DATA
+
+    Renders the template once and issues MAIL + N RCPT + one DATA on the
+    persistent connection, so broadcast cost no longer scales with the
+    recipient count.
+    """
+    try:
+        if not to_emails:
+            return True
+        if not settings.EMAIL_HOST_USER or not settings.EMAIL_HOST_PASSWORD:
+            logger.info(f"BULK EMAIL SKIPPED (no config): {subject} to {len(to_emails)} recipients")
+            return True
+        
+        render_ctx = {**_COMMON, 'current_year': _year(), **context}
+        
+        html_template, text_template = _get_templates(template_name)
+        html_content = html_template.render(**render_ctx)
+        if text_template is not None:
+            text_content = text_template.render(**render_ctx)
+        else:
+            text_content = _TAG_RE.sub('', html_content)
+        
+        from_addr = settings.DEFAULT_FROM_EMAIL or settings.EMAIL_HOST_USER
+        message = MIMEMultipart("alternative")
+        message["Subject"] = f"[{settings.COMPANY_NAME}] {subject}"
+        message["From"] = from_addr
+        # Recipients ride the SMTP envelope only, BCC-style
+        message["To"] = from_addr
+        message.attach(MIMEText(text_content, "plain"))
+        message.attach(MIMEText(html_content, "html"))
+        
+        async with _smtp_lock:
+            try:
+                smtp = await _get_smtp()
+                await smtp.sendmail(from_addr, to_emails, message.as_bytes())
+            except (aiosmtplib.SMTPServerDisconnected, ConnectionError):
+                global _smtp
+                _smtp = None
+                smtp = await _get_smtp()
+                await smtp.sendmail(from_addr, to_emails, message.as_bytes())
+        
+        logger.info(f"Bulk email sent: {subject} to {len(to_emails)} recipients")
+        return True
+        
+    except (aiosmtplib.SMTPException, ConnectionError, OSError, TemplateNotFound) as e:
+        logger.error(f"Failed to send bulk email: {str(e)}")
+        if not fail_silently:
+            raise
+        return False
+    except Exception:
+        logger.exception("Unexpected error sending bulk email")
+        if not fail_silently:
+            raise
+        return False
 
 async def send_verification_email(email: str, verification_code: str, user_name: str = None) -> bool:
     """Send email verification code"""
@@ -88,7 +321,7 @@ async def send_verification_email(email: str, verification_code: str, user_name:
         'verification_code': verification_code,
         'user_name': user_name,
         'expiry_hours': 24,
-        'verification_url': f"{settings.FRONTEND_URL}/verify-email?code={verification_code}&email={email}"
+        'verification_url': _VERIFY_URL % (verification_code, email)
     }
     
     return await send_email(
@@ -104,7 +337,7 @@ async def send_password_reset_email(email: str, reset_code: str, user_name: str
         'reset_code': reset_code,
         'user_name': user_name,
         'expiry_hours': 1,
-        'reset_url': f"{settings.FRONTEND_URL}/reset-password?code={reset_code}&email={email}"
+        'reset_url': _RESET_URL % (reset_code, email)
     }
     
     return await send_email(
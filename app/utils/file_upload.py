@@ -1,65 +1,262 @@
 # app/utils/file_upload.py
-import aiofiles
+import asyncio
 import os
+import tempfile
 from fastapi import UploadFile, HTTPException
 from PIL import Image
-import uuid
+from secrets import token_urlsafe
 from typing import Optional, List
 import magic
 
 from app.config import settings
 
+# pic_scale's SIMD Lanczos kernels beat PIL by a wide margin on the
+# fixed-size thumbnail path; optional so stock Pillow remains the
+# fallback where the wheel is unavailable
+try:
+    from pic_scale import resize as pic_scale_resize, Resampling as PicResampling
+    _HAS_PIC_SCALE = True
+except ImportError:
+    _HAS_PIC_SCALE = False
+
 ALLOWED_IMAGE_EXTENSIONS = {'jpg', 'jpeg', 'png', 'gif', 'webp'}
 ALLOWED_VIDEO_EXTENSIONS = {'mp4', 'avi', 'mov', 'wmv', 'webm'}
 ALLOWED_DOCUMENT_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt', 'ppt', 'pptx'}
 
+# Union computed once; also used as a frozenset so membership checks on
+# the upload path stay O(1)
+_ALL_COURSE_EXTS = frozenset(
+    ALLOWED_IMAGE_EXTENSIONS | ALLOWED_VIDEO_EXTENSIONS | ALLOWED_DOCUMENT_EXTENSIONS
+)
+
+# One Magic instance per process; constructing it reloads the whole
+# magic database from disk
+_MAGIC = magic.Magic(mime=True)
+
+def _expected_mime_prefixes(file_extension: str) -> List[str]:
+    """Coarse MIME prefixes an extension's content must match"""
+    if file_extension in ALLOWED_IMAGE_EXTENSIONS:
+        return ['image/']
+    if file_extension in ALLOWED_VIDEO_EXTENSIONS:
+        return ['video/']
+    return ['application/', 'text/']
+
+# Cap concurrent resizes at the core count so a burst of uploads cannot
+# oversubscribe the CPU with Lanczos work
+_resize_semaphore = asyncio.Semaphore(os.cpu_count() or 2)
+
+# Destination dirs already ensured this process lifetime; os.makedirs
+# stats every path component, which is pure waste per upload
+_created_dirs = set()
+
+def _resize_stream_sync(src, file_path: str, image_size: tuple, max_size: int) -> None:
+    """Thumbnail straight from the upload buffer to disk (CPU-bound)
+
+    Decoding from the spooled upload instead of a freshly written copy
+    means only the resized result touches the destination disk.
+    """
+    src.seek(0, os.SEEK_END)
+    if src.tell() > max_size:
+        raise _FileTooLarge()
+    src.seek(0)
+    with Image.open(src) as img:
+        if img.format == 'JPEG':
+            # Let libjpeg decode at a reduced DCT scale; aiming for 2x
+            # the target leaves Lanczos enough pixels for quality
+            img.draft('RGB', (image_size[0] * 2, image_size[1] * 2))
+        if _HAS_PIC_SCALE:
+            # pic_scale resizes to the exact box it is given, so compute
+            # the aspect-fit target first to match thumbnail(): preserve
+            # the ratio and never upscale
+            scale = min(image_size[0] / img.width, image_size[1] / img.height, 1.0)
+            if scale < 1.0:
+                target = (
+                    max(1, round(img.width * scale)),
+                    max(1, round(img.height * scale)),
+                )
+                img = pic_scale_resize(img, target, PicResampling.LANCZOS)
+        else:
+            img.thumbnail(image_size, Image.Resampling.LANCZOS)
+        img.save(file_path, optimize=True, quality=85)
+
+class _FileTooLarge(Exception):
+    """Raised inside the copy thread when an upload exceeds max_size"""
+
+def _sendfile_sync(src, file_path: str, max_size: int) -> None:
+    """Kernel-to-kernel copy for uploads already spilled to disk
+
+    os.sendfile moves the bytes without them ever entering Python,
+    halving memory bandwidth against a userspace read/write loop.
+    """
+    src.flush()
+    src_fd = src.fileno()
+    size = os.fstat(src_fd).st_size
+    if size > max_size:
+        raise _FileTooLarge()
+    dst_fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    finally:
+        os.close(dst_fd)
+
+def _copy_stream_sync(src, file_path: str, max_size: int) -> None:
+    """Copy the upload's spooled buffer to disk in one thread hop
+
+    A plain blocking copy in a single worker thread beats aiofiles here,
+    which pays a thread dispatch per open/write/close call.
+    """
+    total_bytes = 0
+    src.seek(0)
+    try:
+        with open(file_path, 'wb') as f:
+            while chunk := src.read(1 << 20):
+                total_bytes += len(chunk)
+                if total_bytes > max_size:
+                    raise _FileTooLarge()
+                f.write(chunk)
+    except _FileTooLarge:
+        os.remove(file_path)
+        raise
+
+# Uploads above this size go through the concurrent positioned-write
+# path; below it a single serial writer is faster
+_MULTIPART_THRESHOLD = 32 << 20
+
+async def save_upload_multipart(
+    upload_file: UploadFile,
+    file_path: str,
+    max_size: int,
+    chunk_size: int = 8 << 20,
+    concurrency: int = 4
+) -> None:
+    """Write a large upload with several concurrent positioned writers
+
+    Each chunk is handed to a worker thread doing os.pwrite at its own
+    offset, overlapping write latency on network filesystems where a
+    serial writer is round-trip bound.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _write_at(data: bytes, offset: int) -> None:
+        async with semaphore:
+            await asyncio.to_thread(os.pwrite, fd, data, offset)
+
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    writes = []
+    offset = 0
+    try:
+        await upload_file.seek(0)
+        while chunk := await upload_file.read(chunk_size):
+            offset_for_chunk = offset
+            offset += len(chunk)
+            if offset > max_size:
+                raise _FileTooLarge()
+            writes.append(asyncio.create_task(_write_at(chunk, offset_for_chunk)))
+        if writes:
+            await asyncio.gather(*writes)
+    except BaseException:
+        # Any failure (oversize, read error, cancellation) must not leak
+        # the fd or leave a partial file behind
+        for write in writes:
+            write.cancel()
+        await asyncio.gather(*writes, return_exceptions=True)
+        os.close(fd)
+        os.remove(file_path)
+        raise
+    else:
+        os.close(fd)
+
 async def save_upload_file(
     upload_file: UploadFile,
     destination_dir: str,
-    allowed_extensions: Optional[List[str]] = None,
+    allowed_extensions: Optional[frozenset] = None,
     max_size: int = settings.MAX_UPLOAD_SIZE,
     resize_image: bool = False,
     image_size: tuple = (800, 600)
 ) -> str:
     """Save uploaded file with validation"""
-    
-    # Validate file size
-    contents = await upload_file.read()
-    if len(contents) > max_size:
-        raise HTTPException(
-            status_code=413,
-            detail=f"File too large. Maximum size is {max_size // (1024*1024)}MB"
-        )
-    
-    # Validate file extension
-    file_extension = upload_file.filename.split('.')[-1].lower()
+
+    # Validate file extension before touching the stream or the disk
+    file_extension = os.path.splitext(upload_file.filename)[1][1:].lower()
     if allowed_extensions and file_extension not in allowed_extensions:
         raise HTTPException(
             status_code=400,
             detail=f"File type not allowed. Allowed types: {', '.join(allowed_extensions)}"
         )
-    
-    # Generate unique filename
-    unique_filename = f"{uuid.uuid4()}.{file_extension}"
+
+    # Generate unique filename; token_urlsafe is cheaper than uuid4 and
+    # its string formatting, and still 96 bits of randomness
+    unique_filename = f"{token_urlsafe(12)}.{file_extension}"
     file_path = os.path.join(destination_dir, unique_filename)
-    
-    # Ensure directory exists
-    os.makedirs(destination_dir, exist_ok=True)
-    
-    # Save file
-    async with aiofiles.open(file_path, 'wb') as f:
-        await f.write(contents)
-    
-    # Resize image if needed
+
+    # Reject spoofed extensions from the header bytes before any disk
+    # work; the spooled buffer makes this a cheap in-memory read
+    if allowed_extensions:
+        header = upload_file.file.read(4096)
+        upload_file.file.seek(0)
+        if not validate_file_type(header, _expected_mime_prefixes(file_extension)):
+            raise HTTPException(
+                status_code=400,
+                detail="File content does not match its extension"
+            )
+
+    # Ensure directory exists (once per process per directory)
+    if destination_dir not in _created_dirs:
+        os.makedirs(destination_dir, exist_ok=True)
+        _created_dirs.add(destination_dir)
+
+    # Resized images are decoded straight from the upload buffer so only
+    # the thumbnail is ever written; everything else streams to disk in
+    # 1 MiB chunks so memory stays O(chunk) instead of O(filesize). Both
+    # paths run in a worker thread to keep the event loop responsive.
+    resized = False
     if resize_image and file_extension in ALLOWED_IMAGE_EXTENSIONS:
         try:
-            with Image.open(file_path) as img:
-                img.thumbnail(image_size, Image.Resampling.LANCZOS)
-                img.save(file_path, optimize=True, quality=85)
-        except Exception as e:
-            # If image processing fails, keep original
+            async with _resize_semaphore:
+                await asyncio.to_thread(
+                    _resize_stream_sync, upload_file.file, file_path,
+                    image_size, max_size
+                )
+            resized = True
+        except _FileTooLarge:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size is {max_size // (1024*1024)}MB"
+            )
+        except (OSError, ValueError):
+            # Undecodable or truncated image: fall back to the raw copy
             pass
     
+    if not resized:
+        try:
+            source = upload_file.file
+            if (
+                hasattr(os, "sendfile")
+                and isinstance(source, tempfile.SpooledTemporaryFile)
+                and source._rolled
+            ):
+                # Upload already lives in a real temp file: copy it
+                # kernel-to-kernel without the bytes entering Python
+                await asyncio.to_thread(
+                    _sendfile_sync, source, file_path, max_size
+                )
+            elif upload_file.size and upload_file.size > _MULTIPART_THRESHOLD:
+                await save_upload_multipart(upload_file, file_path, max_size)
+            else:
+                await asyncio.to_thread(
+                    _copy_stream_sync, source, file_path, max_size
+                )
+        except _FileTooLarge:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size is {max_size // (1024*1024)}MB"
+            )
+    
     return f"/static/uploads/{os.path.basename(destination_dir)}/{unique_filename}"
 
 async def save_avatar(upload_file: UploadFile) -> str:
@@ -67,7 +264,7 @@ async def save_avatar(upload_file: UploadFile) -> str:
     return await save_upload_file(
         upload_file=upload_file,
         destination_dir=f"{settings.UPLOAD_DIR}/avatars",
-        allowed_extensions=list(ALLOWED_IMAGE_EXTENSIONS),
+        allowed_extensions=ALLOWED_IMAGE_EXTENSIONS,
         max_size=10 * 1024 * 1024,  # 10MB
         resize_image=True,
         image_size=(400, 400)
@@ -75,18 +272,21 @@ async def save_avatar(upload_file: UploadFile) -> str:
 
 async def save_course_content(upload_file: UploadFile) -> str:
     """Save course content file"""
-    allowed_extensions = list(ALLOWED_IMAGE_EXTENSIONS | ALLOWED_VIDEO_EXTENSIONS | ALLOWED_DOCUMENT_EXTENSIONS)
     return await save_upload_file(
         upload_file=upload_file,
         destination_dir=f"{settings.UPLOAD_DIR}/courses",
-        allowed_extensions=allowed_extensions,
+        allowed_extensions=_ALL_COURSE_EXTS,
         max_size=settings.MAX_UPLOAD_SIZE
     )
 
-def validate_file_type(file_path: str, expected_types: List[str]) -> bool:
-    """Validate file type using python-magic"""
+def validate_file_type(header: bytes, expected_types: List[str]) -> bool:
+    """Validate file content against expected MIME types from its header
+
+    Takes the first bytes of the upload rather than a path, so spoofed
+    files are rejected before anything is written to disk.
+    """
     try:
-        file_mime = magic.from_file(file_path, mime=True)
+        file_mime = _MAGIC.from_buffer(header)
         return any(expected_type in file_mime for expected_type in expected_types)
-    except:
+    except magic.MagicException:
         return False
\ No newline at end of file
@@ -0,0 +1,70 @@
+# tests/test_course_tags.py
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.database import Base
+import app.accounts.models  # noqa: F401  (register tables)
+import app.core.models  # noqa: F401
+from app.courses.services import CourseService
+from app.courses.schemas import CourseCreate, CourseUpdate
+
+
+@pytest_asyncio.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with maker() as session:
+        yield session
+    await engine.dispose()
+
+
+def _course_create(**overrides) -> CourseCreate:
+    data = dict(
+        title="Test Course",
+        slug="test-course",
+        description="desc",
+        short_description="short",
+        learning_outcomes="outcomes",
+    )
+    data.update(overrides)
+    return CourseCreate(**data)
+
+
+@pytest.mark.asyncio
+async def test_create_course_with_tags(db):
+    course = await CourseService.create_course(
+        db, _course_create(tags=["Python", "Data Science"]), instructor_id=1
+    )
+    assert sorted(t.slug for t in course.tags) == ["data-science", "python"]
+
+
+@pytest.mark.asyncio
+async def test_create_course_without_tags(db):
+    course = await CourseService.create_course(db, _course_create(), instructor_id=1)
+    assert course.tags == []
+
+
+@pytest.mark.asyncio
+async def test_update_course_replaces_tags(db):
+    course = await CourseService.create_course(
+        db, _course_create(tags=["Python"]), instructor_id=1
+    )
+    updated = await CourseService.update_course(
+        db, course.id, CourseUpdate(title="Renamed", tags=["Python", "C++"])
+    )
+    assert updated.title == "Renamed"
+    assert sorted(t.slug for t in updated.tags) == ["c", "python"]
+
+
+@pytest.mark.asyncio
+async def test_update_course_without_tags_keeps_them(db):
+    course = await CourseService.create_course(
+        db, _course_create(tags=["Python"]), instructor_id=1
+    )
+    updated = await CourseService.update_course(
+        db, course.id, CourseUpdate(title="Renamed")
+    )
+    assert [t.slug for t in updated.tags] == ["python"]